@@ -0,0 +1,12 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from account.application.usecase.async_account_usecase import AsyncAccountUseCase
+from account.infrastructure.cache.account_email_cache import AccountEmailCache
+from account.infrastructure.repository.async_account_repository_impl import AsyncAccountRepositoryImpl
+from config.database.async_session import get_async_db
+
+
+def get_account_usecase(db: AsyncSession = Depends(get_async_db)) -> AsyncAccountUseCase:
+    # 요청마다 세션 → 리포지토리 → 유스케이스를 새로 묶는다 (세션 공유 없음)
+    return AsyncAccountUseCase(AsyncAccountRepositoryImpl(db), AccountEmailCache.getInstance())
@@ -1,26 +1,45 @@
-import json
-from fastapi import HTTPException, Cookie
-from social_oauth.adapter.input.web.google_oauth2_router import redis_client  # 이미 redis_client 존재한다고 가정
+from fastapi import HTTPException, Cookie, Response
 
-def get_current_user(session_id: str = Cookie(None)) -> int:
+from account.infrastructure.cache.session_cache import SessionCache
+from account.infrastructure.cache.session_ttl_refresher import SESSION_TTL_SECONDS, SessionTtlRefresher
+
+session_cache = SessionCache.getInstance()
+session_refresher = SessionTtlRefresher.getInstance()
+
+
+def set_session_cookie(response: Response, session_id: str) -> None:
+    # HTTP-only 세션 쿠키 (만료 시간은 Redis 세션 TTL 과 같게)
+    response.set_cookie(
+        key="session_id",
+        value=session_id,
+        httponly=True,
+        secure=False,
+        samesite="lax",
+        max_age=SESSION_TTL_SECONDS
+    )
+
+
+def touch_session(response: Response, session_id: str) -> None:
+    """
+    sliding expiration: Redis TTL 연장을 배치에 예약하고, 예약된 경우에만 쿠키 만료도 갱신.
+    """
+    if session_refresher.touch(session_id):
+        set_session_cookie(response, session_id)
+
+
+async def get_current_user(response: Response, session_id: str = Cookie(None)) -> int:
     if not session_id:
         raise HTTPException(status_code=401, detail="세션이 존재하지 않습니다.")
 
-    redis_key = f"session:{session_id}"
-    user_data_bytes = redis_client.get(redis_key)
-    if not user_data_bytes:
+    # 로컬 캐시 → (없으면) Redis 순으로 조회, 디코딩된 dict 를 돌려받는다
+    user_data = await session_cache.get(session_id)
+    if not user_data:
         raise HTTPException(status_code=401, detail="세션이 유효하지 않습니다.")
 
-    # bytes -> str -> dict
-    if isinstance(user_data_bytes, bytes):
-        user_data_str = user_data_bytes.decode("utf-8")
-    else:
-        user_data_str = str(user_data_bytes)
-
     try:
-        user_data = json.loads(user_data_str)
         user_id = int(user_data["user_id"])
-    except (KeyError, ValueError, json.JSONDecodeError):
+    except (KeyError, TypeError, ValueError):
         raise HTTPException(status_code=401, detail="세션 데이터가 올바르지 않습니다.")
 
+    touch_session(response, session_id)
     return user_id
@@ -0,0 +1,25 @@
+from typing import Optional, List
+from abc import ABC, abstractmethod
+from account.domain.account import Account
+
+class AsyncAccountRepositoryPort(ABC):
+
+    @abstractmethod
+    async def save(self, account: Account) -> Account:
+        pass
+
+    @abstractmethod
+    async def upsert_by_email(self, email: str, nickname: str | None) -> Account:
+        pass
+
+    @abstractmethod
+    async def find_by_email(self, email: str) -> Optional[Account]:
+        pass
+
+    @abstractmethod
+    async def find_all_by_id(self, ids: list[int]) -> List[Account]:
+        pass
+
+    @abstractmethod
+    async def count(self) -> int:
+        pass
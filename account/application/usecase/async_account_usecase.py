@@ -0,0 +1,38 @@
+from typing import List, Optional
+
+from account.application.port.async_account_repository_port import AsyncAccountRepositoryPort
+from account.domain.account import Account
+from account.infrastructure.cache.account_email_cache import AccountEmailCache
+
+
+class AsyncAccountUseCase:
+    def __init__(self, account_repository: AsyncAccountRepositoryPort, email_cache: AccountEmailCache | None = None):
+        self.repo = account_repository
+        self.email_cache = email_cache
+
+    async def create_or_get_account(self, email: str, nickname: str | None):
+        # 재로그인: 캐시에 있으면 DB 를 거치지 않는다
+        if self.email_cache is not None:
+            cached = await self.email_cache.get(email)
+            if cached is not None:
+                account = Account(email=email, nickname=cached["nickname"])
+                account.id = cached["id"]
+                return account
+
+        # 조회 + count + 삽입 대신 단일 upsert (테이블 크기와 무관한 비용)
+        account = await self.repo.upsert_by_email(email, nickname)
+
+        if self.email_cache is not None:
+            await self.email_cache.set(email, account.id, account.nickname)
+        return account
+
+    async def get_account_by_id(self, account_id: int) -> Optional[Account]:
+        accounts = await self.get_accounts_by_ids([account_id])
+        return accounts[0] if accounts else None
+
+    async def get_accounts_by_ids(self, ids: list[int]) -> List[Account]:
+
+        if not ids:
+            return []
+
+        return await self.repo.find_all_by_id(ids)
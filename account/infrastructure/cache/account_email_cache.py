@@ -0,0 +1,54 @@
+# account/infrastructure/cache/account_email_cache.py
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+import redis
+
+from config.async_redis_config import get_async_redis
+
+
+class AccountEmailCache:
+    """
+    email → {id, nickname} 캐시. 재로그인 시 DB 를 거치지 않고 계정 id 를 얻는다.
+    (키에는 email 원문 대신 해시를 쓴다. 정규화하지 않는다 — upsert_by_email 과 같은 email 로
+     찾아야 대소문자/공백만 다른 email 이 다른 계정의 id 를 받지 않는다)
+    """
+
+    KEY_PREFIX = "account_email"
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.ttl = int(os.getenv("ACCOUNT_EMAIL_CACHE_TTL", str(24 * 60 * 60)))
+        return cls.__instance
+
+    @classmethod
+    def getInstance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def _key(self, email: str) -> str:
+        digest = hashlib.sha256(email.encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}:{digest}"
+
+    async def get(self, email: str) -> Optional[Dict[str, Any]]:
+        try:
+            raw = await get_async_redis().get(self._key(email))
+        except redis.RedisError:
+            return None
+        return json.loads(raw) if raw else None
+
+    async def set(self, email: str, account_id: int, nickname: str) -> None:
+        try:
+            await get_async_redis().set(
+                self._key(email),
+                json.dumps({"id": account_id, "nickname": nickname}, ensure_ascii=False),
+                ex=self.ttl,
+            )
+        except redis.RedisError as e:
+            print(f"[WARN] account email cache set failed: {e}")
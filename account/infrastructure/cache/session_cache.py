@@ -0,0 +1,192 @@
+# account/infrastructure/cache/session_cache.py
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import redis
+
+from config.async_redis_config import get_async_redis, redis_pipeline
+from config.redis_config import REDIS_DB
+
+# 구독이 끊겼을 때 재연결 대기 시간(초): 최소값에서 시작해 실패할 때마다 두 배, 최대값까지
+SESSION_CACHE_LISTENER_RETRY_MIN = float(os.getenv("SESSION_CACHE_LISTENER_RETRY_MIN", "1"))
+SESSION_CACHE_LISTENER_RETRY_MAX = float(os.getenv("SESSION_CACHE_LISTENER_RETRY_MAX", "30"))
+
+class SessionCache:
+    """
+    로그인 세션(session:{id}) 조회 캐시.
+    - 프로세스 내 LRU 에 디코딩된 세션을 짧게 보관 → 대부분의 인증 요청은 Redis 왕복 없음
+    - 조회/삭제/구독 모두 redis.asyncio 로 수행 (이벤트 루프를 막지 않음)
+    - 로그아웃: Redis 키 삭제 후 pub/sub 채널로 session_id 를 알려 모든 워커가 로컬 항목 제거
+    - 만료: keyspace 알림(__keyevent@{db}__:expired)을 받으면 로컬 항목 제거
+      (알림이 꺼져 있어도 로컬 TTL 이 지나면 Redis 를 다시 확인)
+    - 구독은 백그라운드에서 재시도하며, (재)구독할 때마다 놓친 무효화가 있을 수 있으므로 로컬 캐시를 비운다
+    """
+
+    KEY_PREFIX = "session"
+    INVALIDATE_CHANNEL = "session:invalidate"
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.local_ttl = float(os.getenv("SESSION_CACHE_LOCAL_TTL", "30"))
+            cls.__instance.local_max_size = int(os.getenv("SESSION_CACHE_LOCAL_SIZE", "10000"))
+            cls.__instance.enable_keyspace_events = (
+                os.getenv("SESSION_CACHE_ENABLE_KEYSPACE_EVENTS", "false").lower() == "true"
+            )
+            cls.__instance._local = OrderedDict()
+            cls.__instance._lock = threading.Lock()
+            # 로컬 항목을 지울 때마다 증가. Redis 조회 전후로 값이 다르면 조회 결과를 로컬에 넣지 않는다
+            cls.__instance._generation = 0
+            cls.__instance._listener: asyncio.Task | None = None
+        return cls.__instance
+
+    @classmethod
+    def getInstance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{session_id}"
+
+    def _get_local(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            item = self._local.get(session_id)
+            if item is None:
+                return None
+            expires_at, data = item
+            if expires_at < time.monotonic():
+                del self._local[session_id]
+                return None
+            self._local.move_to_end(session_id)
+            return data
+
+    def _set_local(self, session_id: str, data: Dict[str, Any], generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._local[session_id] = (time.monotonic() + self.local_ttl, data)
+            self._local.move_to_end(session_id)
+            while len(self._local) > self.local_max_size:
+                self._local.popitem(last=False)
+
+    def evict_local(self, session_id: str) -> None:
+        with self._lock:
+            self._local.pop(session_id, None)
+            self._generation += 1
+
+    def clear_local(self) -> None:
+        with self._lock:
+            self._local.clear()
+            self._generation += 1
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        디코딩된 세션 dict. 없거나 형식이 잘못되었으면 None.
+        """
+        data = self._get_local(session_id)
+        if data is not None:
+            return data
+
+        # GET 이 로그아웃(DEL + PUBLISH) 직전에 끝나고 무효화가 먼저 처리되면, 아래에서 로컬에 다시 넣어
+        # 로그아웃된 세션이 로컬 TTL 동안 유효해진다 → 그 사이 무효화가 있었으면 로컬에 넣지 않는다
+        generation = self._generation
+        raw = await get_async_redis().get(self._key(session_id))
+        if not raw:
+            return None
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        self._set_local(session_id, data, generation)
+        return data
+
+    async def delete(self, session_id: str) -> None:
+        """
+        세션 삭제(로그아웃) 후 다른 워커에도 무효화를 알린다. (DEL + PUBLISH 한 번의 왕복)
+        """
+        self.evict_local(session_id)
+        async with redis_pipeline() as pipe:
+            pipe.delete(self._key(session_id))
+            pipe.publish(self.INVALIDATE_CHANNEL, session_id)
+        # DEL 전에 끝난 이 워커의 조회가 그 사이 로컬에 넣었을 수 있다
+        self.evict_local(session_id)
+
+    def _on_message(self, message: Dict[str, Any]) -> None:
+        if message.get("type") != "message":
+            return
+        if message["channel"] == self.INVALIDATE_CHANNEL:
+            self.evict_local(message["data"])
+            return
+
+        # __keyevent@{db}__:expired 의 data 는 만료된 키 이름
+        prefix = f"{self.KEY_PREFIX}:"
+        key = message["data"]
+        if key.startswith(prefix):
+            self.evict_local(key[len(prefix):])
+
+    async def _subscribe(self, client):
+        if self.enable_keyspace_events:
+            # 관리형 Redis 에서는 CONFIG 가 막혀 있을 수 있으므로 실패해도 계속 진행
+            try:
+                await client.config_set("notify-keyspace-events", "Ex")
+            except redis.ResponseError as e:
+                print(f"[WARN] keyspace notifications not enabled: {e}")
+
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(
+                self.INVALIDATE_CHANNEL,
+                f"__keyevent@{REDIS_DB}__:expired",
+            )
+        except BaseException:
+            await pubsub.aclose()
+            raise
+        return pubsub
+
+    async def _listen(self) -> None:
+        delay = SESSION_CACHE_LISTENER_RETRY_MIN
+        while True:
+            pubsub = None
+            try:
+                pubsub = await self._subscribe(get_async_redis())
+                # 구독이 없던 동안의 무효화는 받지 못했으므로 로컬 항목을 모두 버린다
+                self.clear_local()
+                delay = SESSION_CACHE_LISTENER_RETRY_MIN
+                async for message in pubsub.listen():
+                    self._on_message(message)
+                return  # 구독이 모두 해제되면 종료
+            except redis.RedisError as e:
+                # Redis 가 (시작 시점부터) 내려가 있어도 포기하지 않고 재시도한다
+                # (그동안은 로컬 TTL 만큼만 오래된 세션이 보일 수 있다)
+                print(f"[WARN] session cache listener error, retrying in {delay:g}s: {e}")
+            finally:
+                if pubsub is not None:
+                    await pubsub.aclose()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, SESSION_CACHE_LISTENER_RETRY_MAX)
+
+    async def start_listener(self) -> None:
+        """
+        무효화 채널 / 만료 알림 구독 태스크 시작 (lifespan 시작 시 호출).
+        구독은 태스크 안에서 이루어지므로 Redis 가 내려가 있어도 서버 시작을 막지 않는다.
+        """
+        if self._listener is not None:
+            return
+        self._listener = asyncio.create_task(self._listen(), name="session-cache-listener")
+
+    async def stop_listener(self) -> None:
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.cancel()
+            await asyncio.gather(listener, return_exceptions=True)
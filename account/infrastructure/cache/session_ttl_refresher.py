@@ -0,0 +1,112 @@
+# account/infrastructure/cache/session_ttl_refresher.py
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import redis
+
+from config.async_redis_config import redis_pipeline
+
+# 세션 유지 시간(초). 요청이 있을 때마다 이 시간만큼 다시 연장된다 (sliding expiration)
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", str(6 * 60 * 60)))
+
+
+class SessionTtlRefresher:
+    """
+    세션 TTL 연장 배치 처리.
+    - touch(): 요청마다 호출. 최근 SESSION_REFRESH_MIN_INTERVAL 안에 연장한 세션은 건너뜀
+    - 모인 session_id 는 SESSION_REFRESH_FLUSH_INTERVAL 마다 EXPIRE 파이프라인 한 번으로 연장
+      (요청마다 EXPIRE 를 보내지 않으므로 Redis 트래픽이 거의 늘지 않는다)
+    - 이미 삭제/만료된 키에 대한 EXPIRE 는 아무 효과가 없다 (세션이 되살아나지 않음)
+    """
+
+    KEY_PREFIX = "session"
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.ttl = SESSION_TTL_SECONDS
+            cls.__instance.min_interval = float(os.getenv("SESSION_REFRESH_MIN_INTERVAL", "300"))
+            cls.__instance.flush_interval = float(os.getenv("SESSION_REFRESH_FLUSH_INTERVAL", "5"))
+            cls.__instance.batch_size = int(os.getenv("SESSION_REFRESH_BATCH_SIZE", "500"))
+            cls.__instance.max_tracked = int(os.getenv("SESSION_REFRESH_MAX_TRACKED", "100000"))
+            cls.__instance._pending: set[str] = set()
+            cls.__instance._last_refreshed = OrderedDict()
+            cls.__instance._task: Optional[asyncio.Task] = None
+        return cls.__instance
+
+    @classmethod
+    def getInstance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def touch(self, session_id: str) -> bool:
+        """
+        세션 사용을 기록. 이번 호출로 연장이 예약되었으면 True
+        (호출 측은 이때 쿠키 max_age 도 함께 갱신하면 된다).
+        """
+        if session_id in self._pending:
+            return False
+        last = self._last_refreshed.get(session_id)
+        if last is not None and time.monotonic() - last < self.min_interval:
+            return False
+
+        self._pending.add(session_id)
+        return True
+
+    def forget(self, session_id: str) -> None:
+        # 로그아웃 시 호출 (대기 중인 연장 취소)
+        self._pending.discard(session_id)
+        self._last_refreshed.pop(session_id, None)
+
+    async def flush(self) -> int:
+        """
+        대기 중인 세션 TTL 을 batch_size 단위 파이프라인으로 연장. 연장 요청한 수를 반환.
+        """
+        if not self._pending:
+            return 0
+
+        session_ids, self._pending = list(self._pending), set()
+        for start in range(0, len(session_ids), self.batch_size):
+            batch = session_ids[start:start + self.batch_size]
+            try:
+                async with redis_pipeline() as pipe:
+                    for session_id in batch:
+                        pipe.expire(f"{self.KEY_PREFIX}:{session_id}", self.ttl)
+            except redis.RedisError as e:
+                # 실패한 세션은 다음 요청에서 다시 touch 된다
+                print(f"[WARN] session ttl refresh failed ({len(batch)} sessions): {e}")
+                continue
+
+            now = time.monotonic()
+            for session_id in batch:
+                self._last_refreshed[session_id] = now
+                self._last_refreshed.move_to_end(session_id)
+            while len(self._last_refreshed) > self.max_tracked:
+                self._last_refreshed.popitem(last=False)
+        return len(session_ids)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"[ERROR] session ttl refresher: {type(e).__name__}: {e}")
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="session-ttl-refresher")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        # 종료 전에 남은 연장 요청을 보낸다
+        await self.flush()
@@ -0,0 +1,86 @@
+from typing import List
+
+from datetime import datetime
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from account.application.port.async_account_repository_port import AsyncAccountRepositoryPort
+from account.domain.account import Account
+from account.infrastructure.orm.account_orm import AccountORM
+
+
+def _to_account(orm_account: AccountORM) -> Account:
+    account = Account(email=orm_account.email, nickname=orm_account.nickname)
+    account.id = orm_account.id
+    account.created_at = orm_account.created_at
+    account.updated_at = orm_account.updated_at
+    return account
+
+
+class AsyncAccountRepositoryImpl(AsyncAccountRepositoryPort):
+    # 세션은 요청 단위로 주입받는다 (config.database.async_session.get_async_db)
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def save(self, account: Account) -> Account:
+        orm_account = AccountORM(
+            email=account.email,
+            nickname=account.nickname
+        )
+        self.db.add(orm_account)
+        await self.db.commit()
+        await self.db.refresh(orm_account)
+
+        account.id = orm_account.id
+        account.created_at = orm_account.created_at
+        account.updated_at = orm_account.updated_at
+        return account
+
+    async def upsert_by_email(self, email: str, nickname: str | None) -> Account:
+        """
+        email(unique) 기준 단일 INSERT ... ON DUPLICATE KEY 로 계정을 만들거나 기존 id 를 얻는다.
+        - 조회 후 삽입 사이의 경쟁 조건이 없고, count() 같은 테이블 스캔도 없다
+        - nickname 이 없으면 새 행의 id 로 anonymous{id} 를 붙인다 (PK 갱신 한 번)
+        """
+        now = datetime.utcnow()
+        values = dict(email=email, nickname=nickname or "", created_at=now, updated_at=now)
+
+        if self.db.bind.dialect.name == "mysql":
+            # 중복이면 id=LAST_INSERT_ID(id) 로 기존 행의 id 를 lastrowid 로 돌려받는다
+            stmt = mysql.insert(AccountORM).values(**values)
+            stmt = stmt.on_duplicate_key_update(id=func.last_insert_id(AccountORM.id))
+            account_id = (await self.db.execute(stmt)).lastrowid
+        else:
+            # 테스트용 sqlite: ON CONFLICT ... DO UPDATE ... RETURNING
+            stmt = sqlite.insert(AccountORM).values(**values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[AccountORM.email],
+                set_={"email": stmt.excluded.email},
+            ).returning(AccountORM.id)
+            account_id = (await self.db.execute(stmt)).scalar_one()
+
+        if not nickname:
+            # 방금 만든 행만 해당 (기존 계정은 nickname 이 비어 있지 않으므로 0행)
+            await self.db.execute(
+                update(AccountORM)
+                .where(AccountORM.id == account_id, AccountORM.nickname == "")
+                .values(nickname=f"anonymous{account_id}")
+            )
+
+        orm_account = await self.db.get(AccountORM, account_id, populate_existing=True)
+        await self.db.commit()
+        return _to_account(orm_account)
+
+    async def find_by_email(self, email: str) -> Account | None:
+        orm_account = await self.db.scalar(select(AccountORM).where(AccountORM.email == email))
+        if orm_account is None:
+            return None
+        return _to_account(orm_account)
+
+    async def find_all_by_id(self, ids: list[int]) -> List[Account]:
+        orm_accounts = (await self.db.scalars(select(AccountORM).where(AccountORM.id.in_(ids)))).all()
+        return [_to_account(o) for o in orm_accounts]
+
+    async def count(self) -> int:
+        return await self.db.scalar(select(func.count()).select_from(AccountORM))
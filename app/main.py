@@ -1,20 +1,72 @@
 import os
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
 
+from config.async_redis_config import close_async_redis, open_async_redis
+from config.database.async_session import async_engine
+from config.database.pool_stats import pool_stats
 from config.database.session import Base, engine
 
 load_dotenv()
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+
+try:
+    from brotli_asgi import BrotliMiddleware  # 설치되어 있으면 br 우선, 미지원 클라이언트는 gzip
+except ImportError:
+    BrotliMiddleware = None
 
 from documents.adapter.input.web.documents_router import router as documents_router
-from social_oauth.adapter.input.web.google_oauth2_router import authentication_router
-from pdf_analyzer.adapter.input.web.pdf_analyzer_router import pdf_analyzer_router
+from social_oauth.adapter.input.web.google_oauth2_router import authentication_router, service as google_oauth2_service
+from pdf_analyzer.adapter.input.web.pdf_analyzer_router import pdf_analyzer_router, analysis_job_usecase, llm_gateway
 from account.adapter.input.web.accounts_router import router as accounts_router
+from account.infrastructure.cache.session_cache import SessionCache
+from account.infrastructure.cache.session_ttl_refresher import SessionTtlRefresher
+from pdf_analyzer.infrastucture.extractor.pdf_text_extractor import shutdown_pool as shutdown_pdf_extractor
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await open_async_redis()
+    await analysis_job_usecase.start()
+    await SessionCache.getInstance().start_listener()
+    await SessionTtlRefresher.getInstance().start()
+    yield
+    await SessionTtlRefresher.getInstance().stop()
+    await SessionCache.getInstance().stop_listener()
+    await analysis_job_usecase.stop()
+    await llm_gateway.aclose()
+    await google_oauth2_service.aclose()
+    shutdown_pdf_extractor()
+    await async_engine.dispose()
+    engine.dispose()
+    await close_async_redis()
 
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
+
+# 이 크기(바이트) 이상인 응답만 압축
+HTTP_COMPRESS_MIN_SIZE = int(os.getenv("HTTP_COMPRESS_MIN_SIZE", "1024"))
+
+if BrotliMiddleware is not None:
+    app.add_middleware(
+        BrotliMiddleware,
+        minimum_size=HTTP_COMPRESS_MIN_SIZE,
+        quality=int(os.getenv("HTTP_BROTLI_QUALITY", "4")),
+        gzip_fallback=True,
+        # SSE 는 압축 버퍼에 막히지 않도록 제외
+        excluded_handlers=[r"^/pdf-analyzer/analyze/stream$"],
+    )
+else:
+    # text/event-stream(SSE) 은 GZipMiddleware 가 압축하지 않는다
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=HTTP_COMPRESS_MIN_SIZE,
+        compresslevel=int(os.getenv("HTTP_GZIP_LEVEL", "6")),
+    )
 
 origins = [
     "http://localhost:3000",
@@ -33,6 +85,15 @@ app.include_router(accounts_router, prefix="/accounts")
 app.include_router(documents_router, prefix="/documents")
 app.include_router(pdf_analyzer_router, prefix="/pdf-analyzer")
 
+
+@app.get("/health/db-pool")
+async def get_db_pool_stats():
+    # 커넥션 풀 사용량 (checkout 수 / overflow / checkout 대기 시간)
+    return {
+        "sync": pool_stats(engine.pool),
+        "async": pool_stats(async_engine.sync_engine.pool),
+    }
+
 if __name__ == "__main__":
     import uvicorn
     host = os.getenv("APP_HOST")
@@ -0,0 +1,165 @@
+"""
+documents 조회 쿼리 벤치마크.
+
+로컬 DB 에 문서 행을 대량으로 채운 뒤 리포지토리가 실제로 실행하는 조회 쿼리(find_page / count)의
+실행 계획(EXPLAIN)과 지연 시간(p50 / p95)을 출력하고, 기대한 인덱스를 쓰지 않으면 실패한다.
+운영 DB 에서 실행하지 말 것.
+
+    DATABASE_URL=mysql+pymysql://user:pw@localhost:3306/bench \
+        python -m benchmarks.documents_query_benchmark --rows 1000000
+
+    DATABASE_URL=sqlite:///./bench.db python -m benchmarks.documents_query_benchmark --rows 100000
+"""
+
+import argparse
+import random
+import re
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, insert, text
+
+from config.database.session import Base, engine
+from documents.infrastructure.orm.document_orm import DocumentORM
+from documents.infrastructure.orm.document_result_orm import DocumentResultORM  # noqa: F401 (테이블 등록)
+from documents.infrastructure.repository.document_queries import count_query, page_query
+
+STATUSES = ["processing", "completed", "failed"]
+PAGE_SIZE = 21  # find_page 는 다음 페이지 여부 확인을 위해 limit + 1 개를 읽는다
+
+# 리포지토리(find_page / count)가 실제로 실행하는 쿼리와 각각 써야 하는 인덱스
+# (count 는 옵티마이저가 더 작은 인덱스를 고를 수 있어 후보 여러 개를 허용)
+QUERIES = {
+    "list_newest": (
+        lambda p: page_query(PAGE_SIZE),
+        {"ix_documents_uploaded_at_id"},
+    ),
+    "list_failed": (
+        lambda p: page_query(PAGE_SIZE, status="failed"),
+        {"ix_documents_status_uploaded_at_id"},
+    ),
+    "my_documents_newest": (
+        lambda p: page_query(PAGE_SIZE, uploader_id=p["uploader_id"]),
+        {"ix_documents_uploader_uploaded_at_id", "ix_documents_uploader_status_uploaded_at_id"},
+    ),
+    "my_documents_processing": (
+        lambda p: page_query(PAGE_SIZE, uploader_id=p["uploader_id"], status="processing"),
+        {"ix_documents_uploader_status_uploaded_at_id"},
+    ),
+    "my_documents_count": (
+        lambda p: count_query(uploader_id=p["uploader_id"]),
+        {"ix_documents_uploader_uploaded_at_id", "ix_documents_uploader_status_uploaded_at_id"},
+    ),
+    "my_documents_count_processing": (
+        lambda p: count_query(uploader_id=p["uploader_id"], status="processing"),
+        {"ix_documents_uploader_status_uploaded_at_id"},
+    ),
+    "count_failed": (
+        lambda p: count_query(status="failed"),
+        {"ix_documents_status_uploaded_at_id"},
+    ),
+}
+
+INDEX_NAMES = {index.name for index in DocumentORM.__table__.indexes}
+
+
+def seed(rows: int, users: int, batch_size: int) -> None:
+    with engine.connect() as conn:
+        existing = conn.execute(func.count(DocumentORM.id).select()).scalar()
+    if existing >= rows:
+        print(f"[seed] {existing} rows already present, skipping")
+        return
+
+    rng = random.Random(42)
+    started = datetime.utcnow() - timedelta(days=365)
+    remaining = rows - existing
+    print(f"[seed] inserting {remaining} rows ({users} users)")
+
+    t0 = time.perf_counter()
+    with engine.begin() as conn:
+        for offset in range(0, remaining, batch_size):
+            batch = []
+            for i in range(offset, min(offset + batch_size, remaining)):
+                uploaded_at = started + timedelta(seconds=rng.randint(0, 365 * 24 * 3600))
+                batch.append(
+                    dict(
+                        file_name=f"bench-{existing + i}.pdf",
+                        s3_key=f"documents/bench-{existing + i}.pdf",
+                        uploader_id=rng.randint(1, users),
+                        status=rng.choices(STATUSES, weights=[1, 18, 1])[0],
+                        uploaded_at=uploaded_at,
+                        updated_at=uploaded_at + timedelta(minutes=rng.randint(0, 60)),
+                    )
+                )
+            conn.execute(insert(DocumentORM), batch)
+    print(f"[seed] done in {time.perf_counter() - t0:.1f}s")
+
+
+def explain(conn, stmt) -> list:
+    prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+    sql = str(stmt.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+    return [tuple(row) for row in conn.execute(text(prefix + sql))]
+
+
+def chosen_indexes(plan: list) -> set[str]:
+    # sqlite: "SEARCH documents USING COVERING INDEX ix_..." / mysql: key 컬럼
+    return {
+        name
+        for row in plan
+        for name in re.findall(r"\w+", " ".join(str(col) for col in row))
+        if name in INDEX_NAMES
+    }
+
+
+def measure(conn, build, params_list: list[dict]) -> dict:
+    timings = []
+    for params in params_list:
+        stmt = build(params)
+        t0 = time.perf_counter()
+        conn.execute(stmt).fetchall()
+        timings.append((time.perf_counter() - t0) * 1000)
+    timings.sort()
+    return {
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 3),
+        "max_ms": round(timings[-1], 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    seed(args.rows, args.users, args.batch_size)
+
+    rng = random.Random(7)
+    params_list = [{"uploader_id": rng.randint(1, args.users)} for _ in range(args.runs)]
+
+    with engine.connect() as conn:
+        if engine.dialect.name == "mysql":
+            conn.execute(text("ANALYZE TABLE documents"))
+
+        failures = []
+        for name, (build, expected) in QUERIES.items():
+            print(f"\n== {name}")
+            plan = explain(conn, build(params_list[0]))
+            for row in plan:
+                print("   plan:", row)
+            chosen = chosen_indexes(plan)
+            print("   index:", ", ".join(sorted(chosen)) or "(none)")
+            if not chosen & expected:
+                failures.append(f"{name}: expected one of {sorted(expected)}, got {sorted(chosen) or 'none'}")
+            print("   latency:", measure(conn, build, params_list))
+
+    if failures:
+        raise SystemExit("[bench] unexpected query plans:\n  " + "\n  ".join(failures))
+    print("\n[bench] all queries use the expected index")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import redis.asyncio as aioredis
+from dotenv import load_dotenv
+
+from config.redis_config import REDIS_DB, REDIS_HOST, REDIS_PASSWORD, REDIS_PORT
+
+load_dotenv()
+
+# 커넥션 풀 설정
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "5"))  # 풀이 가득 찼을 때 대기 시간
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "5"))
+REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", "2"))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+
+# 비동기 Redis 인스턴스 (Singleton)
+_async_redis_instance = None
+
+
+def get_async_redis() -> aioredis.Redis:
+    """
+    redis.asyncio 클라이언트. 크기가 고정된 BlockingConnectionPool 을 공유한다
+    (풀이 가득 차면 새 연결을 만들지 않고 REDIS_POOL_TIMEOUT 동안 반환을 기다림).
+    """
+    global _async_redis_instance
+    if _async_redis_instance is None:
+        pool = aioredis.BlockingConnectionPool(
+            host=REDIS_HOST,
+            port=REDIS_PORT,
+            db=REDIS_DB,
+            password=REDIS_PASSWORD,
+            decode_responses=True,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            timeout=REDIS_POOL_TIMEOUT,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+            health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+        )
+        _async_redis_instance = aioredis.Redis(connection_pool=pool)
+    return _async_redis_instance
+
+
+def set_async_redis(client: aioredis.Redis | None) -> None:
+    """
+    테스트용: fakeredis.aioredis.FakeRedis 등으로 교체 (None 이면 초기화).
+    """
+    global _async_redis_instance
+    _async_redis_instance = client
+
+
+async def open_async_redis() -> None:
+    # 시작 시 연결을 한 번 확인 (실패해도 서버는 뜨고, 요청 시점에 다시 연결을 시도)
+    try:
+        await get_async_redis().ping()
+    except Exception as e:
+        print(f"[WARN] redis ping failed: {e}")
+
+
+async def close_async_redis() -> None:
+    global _async_redis_instance
+    client, _async_redis_instance = _async_redis_instance, None
+    if client is not None:
+        await client.aclose(close_connection_pool=True)
+
+
+@asynccontextmanager
+async def redis_pipeline(transaction: bool = False) -> AsyncIterator[aioredis.client.Pipeline]:
+    """
+    명령을 모아 한 번의 왕복으로 보낸다. 블록이 끝나면 execute() 결과는 버려지므로
+    결과가 필요하면 블록 안에서 직접 await pipe.execute() 를 호출한다.
+
+        async with redis_pipeline() as pipe:
+            pipe.delete(key)
+            pipe.publish(channel, message)
+    """
+    async with get_async_redis().pipeline(transaction=transaction) as pipe:
+        yield pipe
+        if pipe.command_stack:
+            await pipe.execute()
@@ -0,0 +1,42 @@
+import os
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from config.database.pool_stats import DB_ECHO, InstrumentedAsyncQueuePool, pool_kwargs
+from config.database.session import _mysql_url
+
+# ASYNC_DATABASE_URL 이 있으면 그대로 사용 (예: 테스트용 sqlite+aiosqlite:///./test.db)
+# 동기 엔진과 같은 Base(metadata)를 공유하므로 ORM 모델은 그대로 쓴다
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _mysql_url("aiomysql")
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=DB_ECHO,
+    pool_pre_ping=True,
+    **pool_kwargs(ASYNC_DATABASE_URL, InstrumentedAsyncQueuePool),
+)
+
+# commit 후에도 객체 속성을 그대로 읽을 수 있도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+def get_async_db_session() -> AsyncSession:
+    return AsyncSessionLocal()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    FastAPI 의존성: 요청 하나에 AsyncSession 하나.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
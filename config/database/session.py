@@ -6,17 +6,26 @@ import urllib.parse
 
 load_dotenv()
 
-password = urllib.parse.quote_plus(os.getenv("MYSQL_PASSWORD"))
+# 풀 설정은 .env 를 읽은 뒤에 로드
+from config.database.pool_stats import DB_ECHO, InstrumentedQueuePool, pool_kwargs
+
+
+def _mysql_url(driver: str) -> str:
+    password = urllib.parse.quote_plus(os.getenv("MYSQL_PASSWORD") or "")
+    return (
+        f"mysql+{driver}://{os.getenv('MYSQL_USER')}:{password}"
+        f"@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DATABASE')}"
+    )
 
-DATABASE_URL = (
-    f"mysql+pymysql://{os.getenv('MYSQL_USER')}:{password}"
-    f"@{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}/{os.getenv('MYSQL_DATABASE')}"
-)
+
+# DATABASE_URL 이 있으면 그대로 사용 (예: 테스트용 sqlite:///./test.db)
+DATABASE_URL = os.getenv("DATABASE_URL") or _mysql_url("pymysql")
 
 engine = create_engine(
     DATABASE_URL,
-    echo=True,
-    pool_pre_ping=True
+    echo=DB_ECHO,
+    pool_pre_ping=True,
+    **pool_kwargs(DATABASE_URL, InstrumentedQueuePool),
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -25,3 +34,4 @@ Base = declarative_base()
 
 def get_db_session():
     return SessionLocal()
+
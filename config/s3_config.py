@@ -0,0 +1,32 @@
+import os
+import boto3
+from botocore.config import Config
+from dotenv import load_dotenv
+
+load_dotenv()
+
+AWS_REGION = os.getenv("AWS_REGION")
+AWS_S3_BUCKET = os.getenv("AWS_S3_BUCKET")
+# 로컬 S3 대체(moto 서버, MinIO 등)를 쓸 때만 지정
+AWS_S3_ENDPOINT_URL = os.getenv("AWS_S3_ENDPOINT_URL") or None
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "32"))
+
+# S3 클라이언트 인스턴스 (Singleton, boto3 client는 thread-safe)
+_s3_instance = None
+
+def get_s3_client():
+    global _s3_instance
+    if _s3_instance is None:
+        _s3_instance = boto3.client(
+            "s3",
+            region_name=AWS_REGION,
+            endpoint_url=AWS_S3_ENDPOINT_URL,
+            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+            config=Config(
+                max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                retries={"max_attempts": 5, "mode": "adaptive"},
+                tcp_keepalive=True,
+            ),
+        )
+    return _s3_instance
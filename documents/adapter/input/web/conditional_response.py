@@ -0,0 +1,52 @@
+import hashlib
+from typing import Any, Dict
+
+from fastapi import Request, Response
+from fastapi.responses import ORJSONResponse
+
+
+# 브라우저가 매번 재검증하도록 (변경이 없으면 304 로 본문 없이 응답)
+CACHE_CONTROL = "private, no-cache"
+
+
+def document_etag(dto: Dict[str, Any]) -> str:
+    # 문서 내용(결과 포함)이 바뀌면 version 이 항상 증가한다 (같은 초 안의 여러 번 갱신도 구분)
+    return f'W/"{dto["id"]}-{dto.get("version") or ""}-{dto.get("updated_at") or ""}"'
+
+
+def page_etag(page: Dict[str, Any]) -> str:
+    digest = hashlib.sha1()
+    for item in page.get("items", []):
+        digest.update(f'{item["id"]}:{item.get("version") or ""}:{item.get("updated_at") or ""};'.encode())
+    digest.update((page.get("next_cursor") or "").encode())
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # 약한 비교: W/ 접두사는 무시
+    target = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == target for tag in if_none_match.split(","))
+
+
+def conditional_json(
+    request: Request,
+    content: Any,
+    etag: str,
+    sub_response: Response | None = None,
+) -> Response:
+    """
+    If-None-Match 가 현재 ETag 와 같으면 304 (본문 없음), 아니면 ETag 를 붙인 JSON 응답.
+    sub_response: 의존성이 주입받은 Response 에 설정한 헤더(세션 쿠키 갱신 등)를 옮겨 담는다.
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        response = Response(status_code=304, headers=headers)
+    else:
+        response = ORJSONResponse(content, headers=headers)
+    if sub_response is not None:
+        response.headers.raw.extend(sub_response.headers.raw)
+    return response
@@ -0,0 +1,18 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.database.async_session import get_async_db
+from documents.application.usecase.async_document_usecase import AsyncDocumentUseCase
+from documents.infrastructure.cache.document_cache import DocumentCache
+from documents.infrastructure.repository.async_document_repository_impl import AsyncDocumentRepositoryImpl
+
+
+def get_document_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncDocumentRepositoryImpl:
+    # 요청 단위 세션을 리포지토리에 묶는다 (요청 하나 = 커넥션 하나)
+    return AsyncDocumentRepositoryImpl(db)
+
+
+def get_document_usecase(
+    repository: AsyncDocumentRepositoryImpl = Depends(get_document_repository),
+) -> AsyncDocumentUseCase:
+    return AsyncDocumentUseCase(repository, DocumentCache.getInstance())
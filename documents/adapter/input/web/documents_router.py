@@ -1,15 +1,22 @@
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, status
+from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from documents.application.usecase.document_usecase import DocumentUseCase
-from documents.infrastructure.repository.document_repository_impl import DocumentRepositoryImpl
-# from account.adapter.input.web.session_helper import get_current_user  # 세션 연동 시
+from documents.adapter.input.web.conditional_response import (
+    conditional_json,
+    document_etag,
+    page_etag,
+)
+from documents.adapter.input.web.request.presigned_upload_request import (
+    CompleteUploadRequest,
+    PresignUploadRequest,
+)
+from documents.adapter.input.web.document_dependency import get_document_usecase
+from documents.application.usecase.async_document_usecase import AsyncDocumentUseCase
+from account.adapter.input.web.session_helper import get_current_user
 
-router = APIRouter(tags=["documents"])
-
-repository = DocumentRepositoryImpl.getInstance()
-document_usecase = DocumentUseCase(repository)
+router = APIRouter(tags=["documents"], default_response_class=ORJSONResponse)
 
 
 class UpdateResultRequest(BaseModel):
@@ -20,47 +27,167 @@ class UpdateResultRequest(BaseModel):
 @router.post("/register", status_code=status.HTTP_201_CREATED)
 async def register_document(
     file: UploadFile = File(...),
-    # uploader_id: int = Depends(get_current_user),
+    uploader_id: int = Depends(get_current_user),
+    document_usecase: AsyncDocumentUseCase = Depends(get_document_usecase),
 ):
     # 1) S3 업로드
-    s3_key, file_name = await document_usecase.upload_file_to_s3(file)
-
-    # 로그인 붙이기 전까지는 임시 0
-    uploader_id = 0
+    s3_key, file_name, content_hash = await document_usecase.upload_file_to_s3(file)
 
     # 2) DB 등록 (status="processing", result=None)
-    doc_dto = document_usecase.register_document(
+    doc_dto = await document_usecase.register_document(
         file_name=file_name,
         s3_key=s3_key,
         uploader_id=uploader_id,
+        content_hash=content_hash,
     )
     return doc_dto
 
 
+@router.post("/register/bulk", status_code=status.HTTP_207_MULTI_STATUS)
+async def register_documents_bulk(
+    files: List[UploadFile] = File(...),
+    uploader_id: int = Depends(get_current_user),
+    document_usecase: AsyncDocumentUseCase = Depends(get_document_usecase),
+):
+    """
+    여러 PDF를 한 번에 등록. S3 업로드는 병렬로, DB INSERT는 한 트랜잭션으로 처리하고
+    파일별 성공/실패 결과를 반환한다.
+    """
+    return await document_usecase.register_documents_bulk(files, uploader_id)
+
+
+@router.post("/uploads/presign")
+async def create_presigned_upload(
+    payload: PresignUploadRequest,
+    uploader_id: int = Depends(get_current_user),
+    document_usecase: AsyncDocumentUseCase = Depends(get_document_usecase),
+):
+    """
+    S3 직접 업로드 1단계: presigned PUT URL(큰 파일은 파트별 URL) 발급.
+    """
+    return await document_usecase.create_upload_url(
+        file_name=payload.file_name,
+        content_type=payload.content_type,
+        size=payload.size,
+        uploader_id=uploader_id,
+    )
+
+
+@router.post("/uploads/complete", status_code=status.HTTP_201_CREATED)
+async def complete_presigned_upload(
+    payload: CompleteUploadRequest,
+    uploader_id: int = Depends(get_current_user),
+    document_usecase: AsyncDocumentUseCase = Depends(get_document_usecase),
+):
+    """
+    S3 직접 업로드 2단계: (멀티파트 완료 후) 객체 존재 확인 → 문서 등록.
+    """
+    try:
+        return await document_usecase.complete_upload(
+            s3_key=payload.s3_key,
+            file_name=payload.file_name,
+            uploader_id=uploader_id,
+            upload_token=payload.upload_token,
+            upload_id=payload.upload_id,
+            parts=[p.model_dump() for p in payload.parts or []],
+        )
+    except ValueError as e:
+        # 잘못된 upload_id / parts (InvalidPart, NoSuchUpload 등)
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/list")
-async def list_documents():
-    return document_usecase.list_documents()
+async def list_documents(
+    request: Request,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    uploader_id: int | None = None,
+    status: str | None = None,
+    include_result: bool = False,
+    document_usecase: AsyncDocumentUseCase = Depends(get_document_usecase),
+):
+    try:
+        page = await document_usecase.list_documents(
+            limit=limit,
+            cursor=cursor,
+            uploader_id=uploader_id,
+            status=status,
+            include_result=include_result,
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return conditional_json(request, page, page_etag(page))
+
+
+@router.get("/me")
+async def list_my_documents(
+    request: Request,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    status: str | None = None,
+    include_result: bool = False,
+    uploader_id: int = Depends(get_current_user),
+    document_usecase: AsyncDocumentUseCase = Depends(get_document_usecase),
+):
+    """
+    로그인한 사용자의 문서 목록 (최신순, status 필터 가능).
+    (uploader_id, [status,] uploaded_at, id) 인덱스 범위 스캔으로 처리된다.
+    """
+    try:
+        page = await document_usecase.list_documents(
+            limit=limit,
+            cursor=cursor,
+            uploader_id=uploader_id,
+            status=status,
+            include_result=include_result,
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    # get_current_user 가 갱신한 세션 쿠키를 유지
+    return conditional_json(request, page, page_etag(page), response)
+
+
+@router.get("/me/count")
+async def count_my_documents(
+    status: str | None = None,
+    uploader_id: int = Depends(get_current_user),
+    document_usecase: AsyncDocumentUseCase = Depends(get_document_usecase),
+):
+    return await document_usecase.count_documents(uploader_id=uploader_id, status=status)
+
+
+@router.get("/cache/stats")
+async def get_document_cache_stats(
+    document_usecase: AsyncDocumentUseCase = Depends(get_document_usecase),
+):
+    return document_usecase.cache_stats()
 
 
 @router.get("/{document_id}")
-async def get_document(document_id: int):
-    doc = document_usecase.get_document_by_id(document_id)
+async def get_document(
+    document_id: int,
+    request: Request,
+    document_usecase: AsyncDocumentUseCase = Depends(get_document_usecase),
+):
+    doc = await document_usecase.get_document_by_id(document_id)
     if doc is None:
         raise HTTPException(status_code=404, detail="Document not found")
-    return doc
+    return conditional_json(request, doc, document_etag(doc))
 
 
 @router.patch("/{document_id}/result")
 async def update_document_result(
     document_id: int,
     payload: UpdateResultRequest,
+    document_usecase: AsyncDocumentUseCase = Depends(get_document_usecase),
 ):
     """
     pdf_analyzer 또는 프런트에서 분석이 끝난 후
     결과를 DB에 반영할 때 사용.
     """
     try:
-        doc = document_usecase.update_result(
+        doc = await document_usecase.update_result(
             document_id=document_id,
             result=payload.result,
             status=payload.status or "completed",
@@ -0,0 +1,26 @@
+import os
+from typing import List, Literal
+
+from pydantic import BaseModel, Field
+
+# presigned 업로드로 받을 수 있는 최대 파일 크기 (발급하는 파트 URL 수도 이 크기로 제한된다)
+DOCUMENT_UPLOAD_MAX_BYTES = int(os.getenv("DOCUMENT_UPLOAD_MAX_BYTES", str(512 * 1024 * 1024)))
+
+
+class PresignUploadRequest(BaseModel):
+    file_name: str = Field(..., min_length=1, max_length=200)
+    content_type: Literal["application/pdf"] = "application/pdf"
+    size: int = Field(..., gt=0, le=DOCUMENT_UPLOAD_MAX_BYTES)
+
+
+class UploadedPart(BaseModel):
+    part_number: int = Field(..., ge=1, le=10000)
+    etag: str
+
+
+class CompleteUploadRequest(BaseModel):
+    s3_key: str
+    file_name: str
+    upload_token: str                  # presign 응답의 upload_token
+    upload_id: str | None = None       # 멀티파트 업로드일 때만
+    parts: List[UploadedPart] | None = None
@@ -0,0 +1,85 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+from fastapi import UploadFile
+
+from documents.domain.document import Document
+
+
+class AsyncDocumentRepositoryPort(ABC):
+    """
+    문서 저장소 포트 (S3 업로드 + DB).
+    DB 접근도 await 로 수행해 이벤트 루프를 막지 않는다.
+    """
+
+    @abstractmethod
+    async def upload(self, file: UploadFile) -> tuple[str | None, str | None, str | None]:
+        ...
+
+    @abstractmethod
+    async def create_presigned_upload(
+        self, file_name: str, content_type: str, size: int
+    ) -> dict:
+        ...
+
+    @abstractmethod
+    async def complete_presigned_upload(
+        self,
+        s3_key: str,
+        upload_id: str | None = None,
+        parts: List[dict] | None = None,
+    ) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    async def delete_objects(self, s3_keys: List[str]) -> None:
+        ...
+
+    @abstractmethod
+    async def save(self, document: Document) -> Document:
+        ...
+
+    @abstractmethod
+    async def save_all(self, documents: List[Document]) -> List[Document]:
+        ...
+
+    @abstractmethod
+    async def find_page(
+        self,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        uploader_id: int | None = None,
+        status: str | None = None,
+        include_result: bool = False,
+    ) -> List[Document]:
+        ...
+
+    @abstractmethod
+    async def count(self, uploader_id: int | None = None, status: str | None = None) -> int:
+        ...
+
+    @abstractmethod
+    async def find_by_id(self, document_id: int, include_result: bool = False) -> Optional[Document]:
+        ...
+
+    @abstractmethod
+    async def find_result(self, document_id: int) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    async def find_by_s3_key(self, s3_key: str) -> Optional[Document]:
+        ...
+
+    @abstractmethod
+    async def find_by_content_hash(self, content_hash: str) -> Optional[Document]:
+        ...
+
+    @abstractmethod
+    async def find_by_content_hashes(self, content_hashes: List[str]) -> dict[str, Document]:
+        ...
+
+    @abstractmethod
+    async def update_result(
+        self, document_id: int, result: dict, status: str | None = None
+    ) -> Document:
+        ...
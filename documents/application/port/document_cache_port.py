@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class DocumentCachePort(ABC):
+    """
+    단건 문서 DTO 캐시 포트.
+    get() 이 돌려준 version 을 set() 에 그대로 넘기면, 그 사이 invalidate() 가 있었을 때
+    (DB 조회 이전의 오래된 DTO) 저장하지 않는다.
+    """
+
+    @abstractmethod
+    async def get(self, document_id: int) -> tuple[Optional[Dict[str, Any]], int]:
+        """(캐시된 DTO 또는 None, 현재 무효화 버전)"""
+        ...
+
+    @abstractmethod
+    async def set(self, document_id: int, dto: Dict[str, Any], version: int) -> None:
+        ...
+
+    @abstractmethod
+    async def invalidate(self, *document_ids: int) -> None:
+        ...
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        ...
@@ -0,0 +1,404 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import os
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
+
+from fastapi import UploadFile, HTTPException
+
+from documents.domain.document import Document
+from documents.application.port.async_document_repository_port import AsyncDocumentRepositoryPort
+from documents.application.port.document_cache_port import DocumentCachePort
+
+
+# 목록 조회 한 페이지 최대 크기
+MAX_PAGE_SIZE = 100
+# 일괄 등록 시 동시에 진행하는 S3 업로드 수
+BULK_UPLOAD_CONCURRENCY = int(os.getenv("DOCUMENTS_BULK_UPLOAD_CONCURRENCY", "8"))
+# presign 에서 발급한 upload_token 유효 시간(초). 이 안에 complete 를 호출해야 한다
+UPLOAD_TOKEN_TTL = int(os.getenv("DOCUMENT_UPLOAD_TOKEN_TTL", str(24 * 60 * 60)))
+
+
+@lru_cache(maxsize=1)
+def _s3_base_url() -> str:
+    # 환경 변수는 프로세스 동안 바뀌지 않으므로 한 번만 읽는다 (누락 시 예외는 캐시되지 않음)
+    bucket = os.getenv("AWS_S3_BUCKET")
+    region = os.getenv("AWS_REGION")
+
+    if not bucket or not region:
+        raise RuntimeError("AWS_S3_BUCKET 또는 AWS_REGION 환경 변수가 설정되지 않았습니다.")
+
+    return f"https://{bucket}.s3.{region}.amazonaws.com"
+
+
+@lru_cache(maxsize=1)
+def _upload_token_secret() -> bytes:
+    secret = os.getenv("DOCUMENT_UPLOAD_TOKEN_SECRET")
+    if not secret:
+        raise RuntimeError("DOCUMENT_UPLOAD_TOKEN_SECRET 환경 변수가 설정되지 않았습니다.")
+    return secret.encode()
+
+
+def _sign_upload(s3_key: str, upload_id: str | None, uploader_id: int) -> str:
+    """
+    presign 한 (s3_key, upload_id) 를 요청한 사용자에게 묶는 서명 토큰.
+    complete 는 이 토큰이 있어야만 받으므로 다른 사용자의 객체를 등록/조회할 수 없다.
+    """
+    claims = {"k": s3_key, "u": upload_id, "o": uploader_id, "e": int(time.time()) + UPLOAD_TOKEN_TTL}
+    body = base64.urlsafe_b64encode(json.dumps(claims, separators=(",", ":")).encode()).decode()
+    signature = hmac.new(_upload_token_secret(), body.encode(), hashlib.sha256).hexdigest()
+    return f"{body}.{signature}"
+
+
+def _verify_upload(token: str, s3_key: str, upload_id: str | None, uploader_id: int) -> bool:
+    body, _, signature = token.partition(".")
+    expected = hmac.new(_upload_token_secret(), body.encode(), hashlib.sha256).hexdigest()
+    if not hmac.compare_digest(signature, expected):
+        return False
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(body.encode()))
+    except (ValueError, UnicodeDecodeError):
+        return False
+    return (
+        claims.get("k") == s3_key
+        and claims.get("u") == (upload_id or None)
+        and claims.get("o") == uploader_id
+        and claims.get("e", 0) >= time.time()
+    )
+
+
+class AsyncDocumentUseCase:
+    """
+    Hexagonal Application 계층.
+    - AsyncDocumentRepositoryPort: S3 업로드 + DB 연동 (DB 접근은 await 로 수행)
+    - PDF 분석은 여기서 하지 않고, 별도 /pdf-analyzer/analyze 에서 수행.
+    """
+
+    def __init__(self, repository: AsyncDocumentRepositoryPort, cache: DocumentCachePort | None = None) -> None:
+        self.repository = repository
+        self.cache = cache
+
+    async def upload_file_to_s3(self, file: UploadFile) -> tuple[str, str, str]:
+        """
+        S3에 파일 업로드 후 (s3_key, filename, content_hash)를 반환.
+        """
+        if file is None:
+            raise HTTPException(status_code=404, detail="File Not Found")
+
+        file_key, filename, content_hash = await self.repository.upload(file=file)
+        if not file_key or not filename:
+            raise HTTPException(status_code=404, detail="Upload Failed")
+
+        return file_key, filename, content_hash
+
+    async def create_upload_url(
+        self, file_name: str, content_type: str, size: int, uploader_id: int
+    ) -> Dict[str, Any]:
+        """
+        S3 직접 업로드용 presigned URL 발급 (1단계).
+        complete 에 그대로 돌려보낼 upload_token 을 함께 준다.
+        """
+        presigned = await self.repository.create_presigned_upload(file_name, content_type, size)
+        presigned["upload_token"] = _sign_upload(presigned["s3_key"], presigned.get("upload_id"), uploader_id)
+        return presigned
+
+    async def complete_upload(
+        self,
+        s3_key: str,
+        file_name: str,
+        uploader_id: int,
+        upload_token: str,
+        upload_id: str | None = None,
+        parts: List[Dict[str, Any]] | None = None,
+    ) -> Dict[str, Any]:
+        """
+        S3 직접 업로드 완료 처리 (2단계).
+        upload_token 으로 이 사용자가 presign 받은 s3_key / upload_id 인지 먼저 확인한다.
+        객체가 실제로 올라왔는지 HEAD 로 확인한 뒤 문서를 등록한다.
+        같은 s3_key 로 다시 호출하면(응답 유실 후 재시도 등) 이미 등록된 문서를 그대로 반환한다.
+        """
+        if not s3_key.startswith("documents/"):
+            raise HTTPException(status_code=400, detail="Invalid s3_key")
+        if not _verify_upload(upload_token, s3_key, upload_id, uploader_id):
+            raise HTTPException(status_code=403, detail="Invalid or expired upload_token")
+        if upload_id and not parts:
+            raise HTTPException(status_code=400, detail="parts are required for a multipart upload")
+
+        # 멀티파트는 이미 완료됐으므로 S3 를 다시 호출하지 않는다 (NoSuchUpload 방지)
+        existing = await self.repository.find_by_s3_key(s3_key)
+        if existing is not None:
+            dto = self._to_dto(existing, include_result=False)
+            dto["duplicate_of"] = None
+            return dto
+
+        head = await self.repository.complete_presigned_upload(s3_key, upload_id, parts)
+        if head is None:
+            raise HTTPException(status_code=404, detail="Uploaded object not found")
+
+        return await self.register_document(
+            file_name=file_name,
+            s3_key=s3_key,
+            uploader_id=uploader_id,
+        )
+
+    def _build_s3_url(self, s3_key: str) -> str:
+        """
+        프런트/분석기가 사용할 수 있는 S3 URL 생성.
+        예: https://{bucket}.s3.{region}.amazonaws.com/{key}
+        """
+        return f"{_s3_base_url()}/{s3_key}"
+
+    def _to_dto(self, document: Document, include_result: bool = True) -> Dict[str, Any]:
+        """
+        프런트에서 바로 사용 가능한 DTO로 변환.
+        include_result=False 면 목록용 경량 DTO (result 제외).
+        """
+        status = getattr(document, "status", None)
+        if status is None:
+            status = "completed" if document.result else "processing"
+
+        dto: Dict[str, Any] = {
+            "id": document.id,
+            "file_name": document.file_name,
+            "s3_key": document.s3_key,
+            "file_url": self._build_s3_url(document.s3_key),
+            "uploader_id": document.uploader_id,
+            "content_hash": getattr(document, "content_hash", None),
+            "uploaded_at": document.uploaded_at.isoformat() if document.uploaded_at else None,
+            "updated_at": document.updated_at.isoformat() if document.updated_at else None,
+            "result": getattr(document, "result", None),
+            "status": status,
+            "version": getattr(document, "version", None),
+        }
+        if not include_result:
+            dto.pop("result")
+        return dto
+
+    async def register_document(
+        self,
+        file_name: str,
+        s3_key: str,
+        uploader_id: int,
+        content_hash: str | None = None,
+    ) -> Dict[str, Any]:
+        """
+        1) 도메인 Document 생성
+        2) status = "processing" 으로 초기화
+        3) Repository.save(document)로 DB에 저장
+        4) DTO(dict)로 반환
+           (같은 내용의 문서가 이미 있으면 duplicate_of 에 기존 문서 id)
+        """
+
+        duplicate = None
+        if content_hash:
+            duplicate = await self.repository.find_by_content_hash(content_hash)
+
+        doc = Document.create(file_name, s3_key, uploader_id)
+        setattr(doc, "status", "processing")
+        doc.content_hash = content_hash
+
+        saved = await self.repository.save(doc)
+        dto = self._to_dto(saved)
+        dto["duplicate_of"] = duplicate.id if duplicate else None
+        return dto
+
+    async def register_documents_bulk(
+        self,
+        files: List[UploadFile],
+        uploader_id: int,
+    ) -> Dict[str, Any]:
+        """
+        여러 파일을 한 번에 등록.
+        1) S3 업로드를 동시 실행 수 제한 하에 병렬로 수행
+        2) 업로드에 성공한 파일만 한 트랜잭션으로 일괄 INSERT
+           (INSERT 가 실패해 롤백되면 이번에 올린 S3 객체를 지운다)
+        3) 파일별 결과(성공/실패)를 요청 순서대로 반환
+           (같은 내용이 DB 나 같은 요청의 앞선 파일에 있으면 duplicate_of 에 그 문서 id)
+        """
+        results, pending = await self._upload_bulk(files, uploader_id)
+
+        duplicates: Dict[str, Document] = {}
+        error: Exception | None = None
+        if pending:
+            docs = [doc for _, doc in pending]
+            duplicates = await self.repository.find_by_content_hashes(
+                [d.content_hash for d in docs if d.content_hash]
+            )
+            try:
+                await self.repository.save_all(docs)
+            except Exception as e:
+                error = e
+                await self.repository.delete_objects([d.s3_key for d in docs])
+
+        return self._bulk_response(results, pending, duplicates, error)
+
+    async def _upload_bulk(
+        self,
+        files: List[UploadFile],
+        uploader_id: int,
+    ) -> tuple[List[Dict[str, Any]], List[tuple[int, Document]]]:
+        """
+        S3 병렬 업로드 후 (파일별 결과, INSERT 대기 문서[(결과 index, Document)]) 반환.
+        """
+        semaphore = asyncio.Semaphore(max(1, BULK_UPLOAD_CONCURRENCY))
+
+        async def upload(file: UploadFile):
+            async with semaphore:
+                return await self.repository.upload(file=file)
+
+        uploads = await asyncio.gather(*(upload(f) for f in files), return_exceptions=True)
+
+        results: List[Dict[str, Any]] = []
+        pending: List[tuple[int, Document]] = []
+        for file, uploaded in zip(files, uploads):
+            result: Dict[str, Any] = {"file_name": file.filename}
+            results.append(result)
+
+            if isinstance(uploaded, Exception) or not uploaded[0]:
+                result.update(status="failed", error="Upload Failed")
+                continue
+
+            s3_key, file_name, content_hash = uploaded
+            try:
+                doc = Document.create(file_name, s3_key, uploader_id)
+            except ValueError as e:
+                result.update(status="failed", error=str(e))
+                continue
+            doc.status = "processing"
+            doc.content_hash = content_hash
+            pending.append((len(results) - 1, doc))
+
+        return results, pending
+
+    def _bulk_response(
+        self,
+        results: List[Dict[str, Any]],
+        pending: List[tuple[int, Document]],
+        duplicates: Dict[str, Document],
+        error: Exception | None,
+    ) -> Dict[str, Any]:
+        in_batch: Dict[str, Document] = {}
+        for idx, doc in pending:
+            if error is not None:
+                results[idx].update(status="failed", error=f"DB insert failed: {error}")
+                continue
+            dto = self._to_dto(doc)
+            # DB 에 이미 있던 문서가 우선, 없으면 같은 요청에서 먼저 올린 파일
+            duplicate = duplicates.get(doc.content_hash) or in_batch.get(doc.content_hash)
+            if doc.content_hash:
+                in_batch.setdefault(doc.content_hash, doc)
+            dto["duplicate_of"] = duplicate.id if duplicate else None
+            results[idx].update(status="created", document=dto)
+
+        created = sum(1 for r in results if r["status"] == "created")
+        return {
+            "total": len(results),
+            "created": created,
+            "failed": len(results) - created,
+            "results": results,
+        }
+
+    async def update_result(
+        self,
+        document_id: int,
+        result: Dict[str, Any],
+        status: str = "completed",
+    ) -> Dict[str, Any]:
+        """
+        PDF 분석 결과를 DB에 반영.
+        - result: LLM 분석 결과 JSON
+        - status: "completed" 또는 "failed"
+        """
+
+        try:
+            doc = await self.repository.update_result(document_id, result, status)
+        finally:
+            # 실패해도 (커밋 직후 오류 등) 캐시된 DTO 가 남지 않도록 항상 무효화
+            if self.cache is not None:
+                await self.cache.invalidate(document_id)
+        return self._to_dto(doc)
+
+    @staticmethod
+    def _encode_cursor(document: Document) -> str:
+        raw = f"{document.uploaded_at.isoformat()}|{document.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            uploaded_at, document_id = raw.split("|")
+            return datetime.fromisoformat(uploaded_at), int(document_id)
+        except (ValueError, UnicodeDecodeError):
+            raise ValueError("Invalid cursor")
+
+    async def list_documents(
+        self,
+        limit: int = 20,
+        cursor: str | None = None,
+        uploader_id: int | None = None,
+        status: str | None = None,
+        include_result: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        (uploaded_at, id) 키셋 페이지네이션 목록 (최신순).
+        - cursor: 이전 응답의 next_cursor (없으면 첫 페이지)
+        - 다음 페이지가 없으면 next_cursor = None
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        after = self._decode_cursor(cursor) if cursor else None
+
+        # 다음 페이지 존재 여부를 알기 위해 하나 더 조회
+        docs = await self.repository.find_page(
+            limit + 1,
+            after=after,
+            uploader_id=uploader_id,
+            status=status,
+            include_result=include_result,
+        )
+        return self._page_response(docs, limit, include_result)
+
+    def _page_response(
+        self, docs: List[Document], limit: int, include_result: bool
+    ) -> Dict[str, Any]:
+        # limit + 1 개를 조회했으므로 남는 행이 있으면 다음 페이지가 있다
+        has_more = len(docs) > limit
+        docs = docs[:limit]
+
+        return {
+            "items": [self._to_dto(doc, include_result) for doc in docs],
+            "next_cursor": self._encode_cursor(docs[-1]) if has_more else None,
+        }
+
+    async def count_documents(self, uploader_id: int | None = None, status: str | None = None) -> Dict[str, Any]:
+        return {
+            "uploader_id": uploader_id,
+            "status": status,
+            "count": await self.repository.count(uploader_id=uploader_id, status=status),
+        }
+
+    async def get_document_by_id(self, document_id: int) -> Optional[Dict[str, Any]]:
+        # read-through: 캐시에 없을 때만 DB 조회 후 캐시에 채움
+        # (조회 전에 받은 version 으로 저장해, 그 사이 갱신된 문서의 오래된 DTO 는 캐시에 남지 않는다)
+        version = 0
+        if self.cache is not None:
+            cached, version = await self.cache.get(document_id)
+            if cached is not None:
+                return cached
+
+        doc = await self.repository.find_by_id(document_id, include_result=True)
+        if doc is None:
+            return None
+
+        dto = self._to_dto(doc)
+        if self.cache is not None:
+            await self.cache.set(document_id, dto, version)
+        return dto
+
+    def cache_stats(self) -> Dict[str, Any]:
+        return self.cache.stats() if self.cache is not None else {}
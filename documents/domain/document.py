@@ -10,6 +10,8 @@ class Document:
         self.uploaded_at: datetime = datetime.utcnow()
         self.updated_at: datetime = datetime.utcnow()
         self.result: Optional[dict] = None
+        self.content_hash: Optional[str] = None
+        self.version: int = 1
 
     @classmethod
     def create(cls, file_name: str, s3_key: str, uploader_id: int) -> "Document":
@@ -0,0 +1,167 @@
+# documents/infrastructure/cache/document_cache.py
+
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import orjson
+import redis
+
+from config.async_redis_config import get_async_redis, redis_pipeline
+from documents.application.port.document_cache_port import DocumentCachePort
+
+# 이 크기(바이트)를 넘는 DTO 의 (역)직렬화는 스레드에서 수행해 이벤트 루프를 막지 않는다
+DOCUMENT_CACHE_OFFLOAD_BYTES = int(os.getenv("DOCUMENT_CACHE_OFFLOAD_BYTES", str(256 * 1024)))
+
+# 무효화 버전이 그대로일 때만 DTO 를 저장 (KEYS: dto, version / ARGV: 읽은 버전, 값, TTL)
+_SET_IF_VERSION = """
+if (redis.call('GET', KEYS[2]) or '0') == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+
+
+class DocumentCache(DocumentCachePort):
+    """
+    단건 문서 DTO read-through 캐시.
+    - 1차: 프로세스 내 LRU (짧은 TTL, 크기 제한)
+    - 2차: Redis (워커 간 공유, redis.asyncio)
+    - 문서 저장/결과 갱신 시 invalidate() 로 두 단계 모두 제거하고 문서별 버전을 올린다
+      (갱신 전에 DB 를 읽은 요청이 늦게 set() 해도 버전이 달라 오래된 DTO 가 남지 않음)
+    - 다른 워커의 로컬 LRU는 짧은 로컬 TTL 안에 자연히 만료
+    """
+
+    KEY_PREFIX = "document_dto"
+    VERSION_PREFIX = "document_dto_version"
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.ttl = int(os.getenv("DOCUMENT_CACHE_TTL", "60"))
+            cls.__instance.local_ttl = float(os.getenv("DOCUMENT_CACHE_LOCAL_TTL", "2"))
+            cls.__instance.local_max_size = int(os.getenv("DOCUMENT_CACHE_LOCAL_SIZE", "1000"))
+            cls.__instance._local = OrderedDict()
+            cls.__instance._lock = threading.Lock()
+            cls.__instance._stats = {"local_hits": 0, "redis_hits": 0, "misses": 0, "invalidations": 0}
+        return cls.__instance
+
+    @classmethod
+    def getInstance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def _key(self, document_id: int) -> str:
+        return f"{self.KEY_PREFIX}:{document_id}"
+
+    def _version_key(self, document_id: int) -> str:
+        return f"{self.VERSION_PREFIX}:{document_id}"
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _get_local(self, document_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            item = self._local.get(document_id)
+            if item is None:
+                return None
+            expires_at, dto = item
+            if expires_at < time.monotonic():
+                del self._local[document_id]
+                return None
+            self._local.move_to_end(document_id)
+            return dto
+
+    def _set_local(self, document_id: int, dto: Dict[str, Any]) -> None:
+        with self._lock:
+            self._local[document_id] = (time.monotonic() + self.local_ttl, dto)
+            self._local.move_to_end(document_id)
+            while len(self._local) > self.local_max_size:
+                self._local.popitem(last=False)
+
+    @staticmethod
+    async def _loads(raw: str) -> Dict[str, Any]:
+        if len(raw) > DOCUMENT_CACHE_OFFLOAD_BYTES:
+            return await asyncio.to_thread(orjson.loads, raw)
+        return orjson.loads(raw)
+
+    @staticmethod
+    async def _dumps(dto: Dict[str, Any]) -> bytes:
+        # result 크기로 대략 판단 (parsed_text 가 DTO 크기의 대부분)
+        result = dto.get("result") or {}
+        if len(str(result.get("parsed_text") or "")) > DOCUMENT_CACHE_OFFLOAD_BYTES:
+            return await asyncio.to_thread(orjson.dumps, dto)
+        return orjson.dumps(dto)
+
+    async def get(self, document_id: int) -> tuple[Optional[Dict[str, Any]], int]:
+        dto = self._get_local(document_id)
+        if dto is not None:
+            self._count("local_hits")
+            return dto, 0
+
+        try:
+            raw, version = await get_async_redis().mget(self._key(document_id), self._version_key(document_id))
+        except redis.RedisError:
+            # Redis 를 못 쓰면 set() 이 버전을 확인할 수 없으므로 저장하지 않도록 -1
+            self._count("misses")
+            return None, -1
+        version = int(version or 0)
+        if raw is None:
+            self._count("misses")
+            return None, version
+
+        dto = await self._loads(raw)
+        self._set_local(document_id, dto)
+        self._count("redis_hits")
+        return dto, version
+
+    async def set(self, document_id: int, dto: Dict[str, Any], version: int) -> None:
+        if version < 0:
+            return
+        try:
+            stored = await get_async_redis().eval(
+                _SET_IF_VERSION,
+                2,
+                self._key(document_id),
+                self._version_key(document_id),
+                str(version),
+                await self._dumps(dto),
+                self.ttl,
+            )
+        except redis.RedisError as e:
+            print(f"[WARN] document cache set failed: {e}")
+            return
+        # 그 사이 무효화됐다면 로컬에도 넣지 않는다
+        if stored:
+            self._set_local(document_id, dto)
+
+    async def invalidate(self, *document_ids: int) -> None:
+        with self._lock:
+            for document_id in document_ids:
+                self._local.pop(document_id, None)
+        try:
+            async with redis_pipeline() as pipe:
+                for document_id in document_ids:
+                    pipe.incr(self._version_key(document_id))
+                    # 진행 중인 조회보다 충분히 길게 유지 (만료 후 0 으로 돌아가도 안전하도록)
+                    pipe.expire(self._version_key(document_id), self.ttl * 10)
+                    pipe.delete(self._key(document_id))
+        except redis.RedisError as e:
+            print(f"[WARN] document cache invalidate failed: {e}")
+        with self._lock:
+            self._stats["invalidations"] += len(document_ids)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["local_size"] = len(self._local)
+        lookups = stats["local_hits"] + stats["redis_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["local_hits"] + stats["redis_hits"]) / lookups, 3) if lookups else 0.0
+        return stats
@@ -1,14 +1,28 @@
-from sqlalchemy import Column, Integer, String, DateTime, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Index
 from datetime import datetime
 from config.database.session import Base
 
 class DocumentORM(Base):
+    # 목록/조회에 쓰이는 가벼운 행만 둔다. 분석 결과(result)는 document_results 에 별도 저장
     __tablename__ = "documents"
+    __table_args__ = (
+        # 목록 키셋 페이지네이션 (uploaded_at DESC, id DESC)
+        Index("ix_documents_uploaded_at_id", "uploaded_at", "id"),
+        # 내 문서 목록 / 개수 (uploader_id = ? ORDER BY uploaded_at DESC, id DESC)
+        Index("ix_documents_uploader_uploaded_at_id", "uploader_id", "uploaded_at", "id"),
+        # 내 문서 중 상태 필터 (uploader_id = ? AND status = ? ORDER BY uploaded_at DESC)
+        Index("ix_documents_uploader_status_uploaded_at_id", "uploader_id", "status", "uploaded_at", "id"),
+        # 전체 문서 중 상태 필터 (status = ? ORDER BY uploaded_at DESC, id DESC) - 상태별 개수도 이 인덱스를 쓴다
+        Index("ix_documents_status_uploaded_at_id", "status", "uploaded_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     file_name = Column(String(255), nullable=False)
-    s3_key = Column(String(255), nullable=False)
+    s3_key = Column(String(255), nullable=False, index=True)
+    content_hash = Column(String(64), nullable=True, index=True)  # sha256 (중복 업로드 판별)
     uploader_id = Column(Integer, nullable=False)
     uploaded_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    result = Column(JSON, nullable=True)
\ No newline at end of file
+    status = Column(String(20), nullable=False, default="processing")
+    # 결과/상태가 바뀔 때마다 1씩 증가 (ETag 용. updated_at 은 초 단위라 같은 초의 변경을 구분 못 한다)
+    version = Column(Integer, nullable=False, default=1)
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, LargeBinary
+from sqlalchemy.dialects.mysql import LONGBLOB
+from datetime import datetime
+from config.database.session import Base
+
+class DocumentResultORM(Base):
+    # 문서별 분석 결과 (압축된 JSON). 결과가 필요한 조회에서만 읽는다
+    __tablename__ = "document_results"
+
+    document_id = Column(
+        Integer,
+        ForeignKey("documents.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    encoding = Column(String(10), nullable=False, default="zlib")
+    payload = Column(LargeBinary().with_variant(LONGBLOB(), "mysql"), nullable=False)
+    raw_size = Column(Integer, nullable=False, default=0)  # 압축 전 JSON 바이트 수
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
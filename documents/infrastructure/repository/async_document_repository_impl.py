@@ -0,0 +1,274 @@
+# documents/infrastructure/repository/async_document_repository_impl.py
+
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator, List
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.database.async_session import AsyncSessionLocal
+from documents.application.port.async_document_repository_port import AsyncDocumentRepositoryPort
+from documents.domain.document import Document
+from documents.infrastructure.orm.document_orm import DocumentORM
+from documents.infrastructure.orm.document_result_orm import DocumentResultORM
+from documents.infrastructure.repository.document_queries import count_query, page_query
+from documents.infrastructure.repository.result_codec import decode_result, encode_result
+from documents.infrastructure.repository.document_s3_storage import DocumentS3Storage
+
+
+
+def _to_document(obj: DocumentORM, result_row: DocumentResultORM | None = None) -> Document:
+    doc = Document(
+        file_name=obj.file_name,
+        s3_key=obj.s3_key,
+        uploader_id=obj.uploader_id,
+    )
+    doc.id = obj.id
+    doc.uploaded_at = obj.uploaded_at
+    doc.updated_at = obj.updated_at
+    doc.content_hash = obj.content_hash
+    doc.status = obj.status
+    doc.version = obj.version
+    # result 는 document_results 를 함께 조회한 경우에만 채운다
+    if result_row is not None:
+        doc.result = decode_result(result_row.encoding, result_row.payload)
+    return doc
+
+
+def _to_result_row(document_id: int, result: dict) -> DocumentResultORM:
+    encoding, payload, raw_size = encode_result(result)
+    return DocumentResultORM(
+        document_id=document_id,
+        encoding=encoding,
+        payload=payload,
+        raw_size=raw_size,
+    )
+
+
+class AsyncDocumentRepositoryImpl(DocumentS3Storage, AsyncDocumentRepositoryPort):
+    """
+    AsyncSession 기반 DocumentRepository.
+    - 요청 처리 중에는 get_async_db 가 주입한 요청 단위 세션 하나를 모든 호출이 함께 쓴다
+      (요청 하나가 커넥션 하나만 checkout)
+    - 세션 없이 만든 인스턴스(getInstance, 분석 작업 워커 등)는 호출마다 세션을 열고 닫는다
+    - 지연 로딩은 AsyncSession 에서 동작하지 않으므로 필요한 컬럼은 쿼리에서 모두 읽는다
+    """
+
+    __instance = None
+
+    def __init__(self, db: AsyncSession | None = None):
+        self.db = db
+
+    @classmethod
+    def getInstance(cls):
+        # 요청 밖(백그라운드 작업)에서 쓰는 세션 없는 공유 인스턴스
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        if self.db is not None:
+            yield self.db
+            return
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    async def save(self, document: Document) -> Document:
+        async with self._session() as db:
+            try:
+                db_obj = DocumentORM(
+                    file_name=document.file_name,
+                    s3_key=document.s3_key,
+                    uploader_id=document.uploader_id,
+                    content_hash=getattr(document, "content_hash", None),
+                    status=getattr(document, "status", None) or "processing",
+                )
+                db.add(db_obj)
+                await db.flush()
+
+                result = getattr(document, "result", None)
+                if result is not None:
+                    db.add(_to_result_row(db_obj.id, result))
+
+                await db.commit()
+                await db.refresh(db_obj)
+            except Exception:
+                await db.rollback()
+                raise
+
+            # DB에서 받은 id와 timestamp, status를 도메인 객체에 반영
+            document.id = db_obj.id
+            document.uploaded_at = db_obj.uploaded_at
+            document.updated_at = db_obj.updated_at
+            document.status = db_obj.status
+
+        return document
+
+    async def save_all(self, documents: List[Document]) -> List[Document]:
+        """
+        여러 문서를 한 트랜잭션에서 일괄 INSERT 한다.
+        (executemany → 다중 행 INSERT, 생성된 id는 s3_key 로 한 번에 다시 조회)
+        """
+        if not documents:
+            return []
+
+        async with self._session() as db:
+            try:
+                await db.execute(
+                    insert(DocumentORM),
+                    [
+                        dict(
+                            file_name=document.file_name,
+                            s3_key=document.s3_key,
+                            uploader_id=document.uploader_id,
+                            content_hash=getattr(document, "content_hash", None),
+                            status=getattr(document, "status", None) or "processing",
+                        )
+                        for document in documents
+                    ],
+                )
+                objs = (
+                    await db.scalars(
+                        select(DocumentORM)
+                        .where(DocumentORM.s3_key.in_([d.s3_key for d in documents]))
+                    )
+                ).all()
+
+                by_key = {obj.s3_key: obj for obj in objs}
+                for document in documents:
+                    obj = by_key[document.s3_key]
+                    document.id = obj.id
+                    document.uploaded_at = obj.uploaded_at
+                    document.updated_at = obj.updated_at
+                    document.status = obj.status
+                    if getattr(document, "result", None) is not None:
+                        db.add(_to_result_row(obj.id, document.result))
+
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+        return documents
+
+    async def find_page(
+        self,
+        limit: int,
+        after: tuple[datetime, int] | None = None,
+        uploader_id: int | None = None,
+        status: str | None = None,
+        include_result: bool = False,
+    ) -> List[Document]:
+        """
+        (uploaded_at, id) 키셋 페이지네이션. 최신순으로 after 다음 행부터 limit 개.
+        include_result=True 일 때만 해당 페이지의 결과를 한 번의 쿼리로 함께 읽는다.
+        """
+        stmt = page_query(limit, after, uploader_id, status)
+
+        async with self._session() as db:
+            objs = (await db.scalars(stmt)).all()
+
+            rows: dict[int, DocumentResultORM] = {}
+            if include_result and objs:
+                rows = {
+                    row.document_id: row
+                    for row in await db.scalars(
+                        select(DocumentResultORM)
+                        .where(DocumentResultORM.document_id.in_([obj.id for obj in objs]))
+                    )
+                }
+            return [_to_document(obj, rows.get(obj.id)) for obj in objs]
+
+    async def count(self, uploader_id: int | None = None, status: str | None = None) -> int:
+        """
+        조건에 맞는 문서 수. (uploader_id, status, ...) 인덱스만으로 계산된다.
+        """
+        async with self._session() as db:
+            return await db.scalar(count_query(uploader_id, status))
+
+    async def find_by_id(self, document_id: int, include_result: bool = False) -> Document | None:
+        async with self._session() as db:
+            obj = await db.get(DocumentORM, document_id)
+            if obj is None:
+                return None
+            row = await db.get(DocumentResultORM, document_id) if include_result else None
+            return _to_document(obj, row)
+
+    async def find_result(self, document_id: int) -> dict | None:
+        async with self._session() as db:
+            row = await db.get(DocumentResultORM, document_id)
+            return decode_result(row.encoding, row.payload) if row is not None else None
+
+    async def find_by_s3_key(self, s3_key: str) -> Document | None:
+        async with self._session() as db:
+            obj = await db.scalar(
+                select(DocumentORM)
+                .where(DocumentORM.s3_key == s3_key)
+                .order_by(DocumentORM.id)
+                .limit(1)
+            )
+            if obj is None:
+                return None
+            return _to_document(obj)
+
+    async def find_by_content_hash(self, content_hash: str) -> Document | None:
+        async with self._session() as db:
+            obj = await db.scalar(
+                select(DocumentORM)
+                .where(DocumentORM.content_hash == content_hash)
+                .order_by(DocumentORM.id)
+                .limit(1)
+            )
+            if obj is None:
+                return None
+            return _to_document(obj)
+
+    async def find_by_content_hashes(self, content_hashes: List[str]) -> dict[str, Document]:
+        """
+        content_hash 별로 가장 먼저 등록된 문서를 한 번의 쿼리로 조회.
+        """
+        if not content_hashes:
+            return {}
+
+        async with self._session() as db:
+            objs = (
+                await db.scalars(
+                    select(DocumentORM)
+                    .where(DocumentORM.content_hash.in_(set(content_hashes)))
+                    .order_by(DocumentORM.id)
+                )
+            ).all()
+            found: dict[str, Document] = {}
+            for obj in objs:
+                found.setdefault(obj.content_hash, _to_document(obj))
+            return found
+
+    async def update_result(
+        self,
+        document_id: int,
+        result: dict,
+        status: str | None = None,
+    ) -> Document:
+        """
+        분석 결과(document_results) 및 상태(documents)를 업데이트하고 도메인 Document로 반환.
+        (문서 캐시 무효화는 호출한 유스케이스가 DocumentCachePort 로 한다)
+        """
+        async with self._session() as db:
+            obj = await db.get(DocumentORM, document_id)
+            if obj is None:
+                raise ValueError(f"Document(id={document_id}) not found")
+
+            if status is not None:
+                obj.status = status
+            obj.updated_at = datetime.utcnow()
+            # UPDATE 안에서 증가시켜 동시 갱신도 서로 다른 버전을 받는다
+            obj.version = DocumentORM.version + 1
+            await db.merge(_to_result_row(document_id, result))
+
+            await db.commit()
+            await db.refresh(obj)
+
+            document = _to_document(obj)
+            document.result = result
+            return document
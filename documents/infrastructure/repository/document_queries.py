@@ -0,0 +1,51 @@
+# documents/infrastructure/repository/document_queries.py
+
+from datetime import datetime
+
+from sqlalchemy import Select, and_, func, or_, select
+
+from documents.infrastructure.orm.document_orm import DocumentORM
+
+
+# 리포지토리와 벤치마크(benchmarks/documents_query_benchmark.py)가 같은 쿼리를 쓰도록 분리한다
+
+
+def page_query(
+    limit: int,
+    after: tuple[datetime, int] | None = None,
+    uploader_id: int | None = None,
+    status: str | None = None,
+) -> Select:
+    """
+    (uploaded_at, id) 키셋 페이지네이션. 최신순으로 after 다음 행부터 limit 개.
+    필터 조합마다 ([uploader_id,] [status,] uploaded_at, id) 인덱스 하나로 범위 스캔된다.
+    """
+    stmt = select(DocumentORM)
+    if uploader_id is not None:
+        stmt = stmt.where(DocumentORM.uploader_id == uploader_id)
+    if status is not None:
+        stmt = stmt.where(DocumentORM.status == status)
+    if after is not None:
+        after_uploaded_at, after_id = after
+        stmt = stmt.where(
+            or_(
+                DocumentORM.uploaded_at < after_uploaded_at,
+                and_(
+                    DocumentORM.uploaded_at == after_uploaded_at,
+                    DocumentORM.id < after_id,
+                ),
+            )
+        )
+    return stmt.order_by(DocumentORM.uploaded_at.desc(), DocumentORM.id.desc()).limit(limit)
+
+
+def count_query(uploader_id: int | None = None, status: str | None = None) -> Select:
+    """
+    조건에 맞는 문서 수. (uploader_id, status, ...) 인덱스만으로 계산된다.
+    """
+    stmt = select(func.count(DocumentORM.id))
+    if uploader_id is not None:
+        stmt = stmt.where(DocumentORM.uploader_id == uploader_id)
+    if status is not None:
+        stmt = stmt.where(DocumentORM.status == status)
+    return stmt
@@ -0,0 +1,276 @@
+# documents/infrastructure/repository/document_s3_storage.py
+
+import asyncio
+import hashlib
+import math
+import os
+import uuid
+
+from typing import List
+from botocore.exceptions import ClientError
+
+from fastapi import UploadFile
+
+from config.s3_config import get_s3_client
+
+
+s3_client = get_s3_client()
+
+# 멀티파트 업로드 파트 크기(S3 최소 5MB) / 업로드 하나당 동시에 전송하는 파트 수
+# 업로드 하나가 쓰는 메모리는 대략 part_size * (concurrency + 1) 로 제한된다
+S3_UPLOAD_PART_SIZE = max(5 * 1024 * 1024, int(os.getenv("S3_UPLOAD_PART_SIZE", str(8 * 1024 * 1024))))
+S3_UPLOAD_CONCURRENCY = int(os.getenv("S3_UPLOAD_CONCURRENCY", "4"))
+
+# presigned 업로드: URL 유효 시간(초) / 이 크기를 넘으면 멀티파트 파트별 URL 발급
+S3_PRESIGN_EXPIRES = int(os.getenv("S3_PRESIGN_EXPIRES", "3600"))
+S3_PRESIGN_MULTIPART_THRESHOLD = int(os.getenv("S3_PRESIGN_MULTIPART_THRESHOLD", str(100 * 1024 * 1024)))
+S3_MAX_PARTS = 10000
+S3_DELETE_BATCH = 1000  # delete_objects 한 번에 지울 수 있는 최대 키 수
+# 클라이언트가 보낸 upload_id / parts 가 잘못된 경우의 complete_multipart_upload 오류 코드
+S3_INVALID_UPLOAD_CODES = ("InvalidPart", "InvalidPartOrder", "NoSuchUpload", "EntityTooSmall", "MalformedXML")
+
+
+class DocumentS3Storage:
+    """
+    문서 파일의 S3 업로드 / presigned 업로드 처리.
+    DocumentRepository 구현이 상속해 사용한다.
+    """
+
+    async def upload(self, file: UploadFile):
+        """
+        UploadFile 스트림을 파트 단위로 읽어 S3 멀티파트 업로드로 전송한다.
+        - 전체 파일을 메모리에 올리지 않음 (동시 전송 파트 수만큼만 보관)
+        - boto3 호출은 스레드에서 수행해 이벤트 루프를 막지 않음
+        - 전송하면서 sha256 해시를 계산해 중복 파일 판별에 사용
+        반환: (s3_key, filename, content_hash)
+        """
+        file_key = f"documents/{uuid.uuid4()}-{file.filename}"
+        bucket = os.getenv("AWS_S3_BUCKET")
+        content_type = file.content_type or "application/octet-stream"
+        hasher = hashlib.sha256()
+        upload_id = None
+        tasks: list[asyncio.Task] = []
+
+        try:
+            data = await file.read(S3_UPLOAD_PART_SIZE)
+            hasher.update(data)
+
+            if len(data) < S3_UPLOAD_PART_SIZE:
+                # 파트 하나로 끝나는 작은 파일은 단일 PUT
+                await asyncio.to_thread(
+                    s3_client.put_object,
+                    Bucket=bucket,
+                    Key=file_key,
+                    Body=data,
+                    ContentType=content_type,
+                )
+                return file_key, file.filename, hasher.hexdigest()
+
+            created = await asyncio.to_thread(
+                s3_client.create_multipart_upload,
+                Bucket=bucket,
+                Key=file_key,
+                ContentType=content_type,
+            )
+            upload_id = created["UploadId"]
+
+            semaphore = asyncio.Semaphore(max(1, S3_UPLOAD_CONCURRENCY))
+            etags: dict[int, str] = {}
+
+            async def send(part_number: int, body: bytes) -> None:
+                try:
+                    response = await asyncio.to_thread(
+                        s3_client.upload_part,
+                        Bucket=bucket,
+                        Key=file_key,
+                        UploadId=upload_id,
+                        PartNumber=part_number,
+                        Body=body,
+                    )
+                    etags[part_number] = response["ETag"]
+                finally:
+                    semaphore.release()
+
+            part_number = 1
+            while data:
+                # 전송 중인 파트가 가득 차면 하나가 끝날 때까지 다음 파트를 읽지 않는다
+                await semaphore.acquire()
+                failed = next((t for t in tasks if t.done() and t.exception()), None)
+                if failed is not None:
+                    semaphore.release()
+                    raise failed.exception()
+
+                tasks.append(asyncio.create_task(send(part_number, data)))
+                part_number += 1
+                data = await file.read(S3_UPLOAD_PART_SIZE)
+                hasher.update(data)
+
+            # gather 와 달리 wait 는 취소돼도 전송 작업을 취소하지 않는다 (정리 단계에서 끝까지 기다린다)
+            await asyncio.wait(tasks)
+            failed = next((t for t in tasks if t.exception()), None)
+            if failed is not None:
+                raise failed.exception()
+            await asyncio.to_thread(
+                s3_client.complete_multipart_upload,
+                Bucket=bucket,
+                Key=file_key,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": [
+                        {"PartNumber": n, "ETag": etags[n]} for n in sorted(etags)
+                    ]
+                },
+            )
+            print(file_key, file.filename)
+            return file_key, file.filename, hasher.hexdigest()
+        except BaseException as e:
+            # 전송 중인 파트(스레드)는 취소할 수 없으므로 모두 끝난 뒤에 abort 해야
+            # abort 이후에 파트가 올라가 고아 스토리지로 남지 않는다
+            cancelled = False
+            pending = {t for t in tasks if not t.done()}
+            while pending:
+                try:
+                    _, pending = await asyncio.wait(pending)
+                except asyncio.CancelledError:
+                    cancelled = True
+            for task in tasks:
+                task.exception()  # "Task exception was never retrieved" 방지
+            if upload_id is not None:
+                try:
+                    await asyncio.to_thread(
+                        s3_client.abort_multipart_upload,
+                        Bucket=bucket,
+                        Key=file_key,
+                        UploadId=upload_id,
+                    )
+                except Exception as abort_error:
+                    print(abort_error)
+            if cancelled:
+                raise asyncio.CancelledError
+            if not isinstance(e, Exception):
+                raise  # 요청 취소 등은 정리 후 그대로 전파
+            print(e)
+            return None, None, None
+
+    async def create_presigned_upload(self, file_name: str, content_type: str, size: int) -> dict:
+        """
+        클라이언트가 S3에 직접 올릴 수 있는 presigned URL 발급.
+        - 작은 파일: PUT URL 하나
+        - 큰 파일: 멀티파트 업로드 생성 후 파트별 PUT URL
+        (서버는 파일 바이트를 전혀 다루지 않는다)
+        """
+        file_key = f"documents/{uuid.uuid4()}-{file_name.replace('/', '_')}"
+        bucket = os.getenv("AWS_S3_BUCKET")
+
+        if size <= S3_PRESIGN_MULTIPART_THRESHOLD:
+            url = s3_client.generate_presigned_url(
+                "put_object",
+                Params={"Bucket": bucket, "Key": file_key, "ContentType": content_type},
+                ExpiresIn=S3_PRESIGN_EXPIRES,
+            )
+            return {
+                "s3_key": file_key,
+                "method": "PUT",
+                "url": url,
+                "headers": {"Content-Type": content_type},
+                "expires_in": S3_PRESIGN_EXPIRES,
+            }
+
+        part_size = max(S3_UPLOAD_PART_SIZE, math.ceil(size / S3_MAX_PARTS))
+        part_count = math.ceil(size / part_size)
+
+        created = await asyncio.to_thread(
+            s3_client.create_multipart_upload,
+            Bucket=bucket,
+            Key=file_key,
+            ContentType=content_type,
+        )
+        upload_id = created["UploadId"]
+
+        def sign_parts() -> list[dict]:
+            return [
+                {
+                    "part_number": n,
+                    "url": s3_client.generate_presigned_url(
+                        "upload_part",
+                        Params={
+                            "Bucket": bucket,
+                            "Key": file_key,
+                            "UploadId": upload_id,
+                            "PartNumber": n,
+                        },
+                        ExpiresIn=S3_PRESIGN_EXPIRES,
+                    ),
+                }
+                for n in range(1, part_count + 1)
+            ]
+
+        # 파트 수만큼 서명 계산이 반복되므로 이벤트 루프 밖에서 만든다
+        parts = await asyncio.to_thread(sign_parts)
+        return {
+            "s3_key": file_key,
+            "method": "MULTIPART",
+            "upload_id": upload_id,
+            "part_size": part_size,
+            "parts": parts,
+            "expires_in": S3_PRESIGN_EXPIRES,
+        }
+
+    async def complete_presigned_upload(
+        self,
+        s3_key: str,
+        upload_id: str | None = None,
+        parts: List[dict] | None = None,
+    ) -> dict | None:
+        """
+        (멀티파트라면 완료 처리 후) HEAD 로 객체 존재를 확인한다.
+        객체가 없으면 None, upload_id / parts 가 잘못됐으면 ValueError.
+        """
+        bucket = os.getenv("AWS_S3_BUCKET")
+
+        if upload_id:
+            try:
+                await asyncio.to_thread(
+                    s3_client.complete_multipart_upload,
+                    Bucket=bucket,
+                    Key=s3_key,
+                    UploadId=upload_id,
+                    MultipartUpload={
+                        "Parts": [
+                            {"PartNumber": p["part_number"], "ETag": p["etag"]}
+                            for p in sorted(parts or [], key=lambda p: p["part_number"])
+                        ]
+                    },
+                )
+            except ClientError as e:
+                code = e.response.get("Error", {}).get("Code")
+                if code in S3_INVALID_UPLOAD_CODES:
+                    raise ValueError(f"Invalid multipart upload: {code}") from e
+                raise
+
+        try:
+            return await asyncio.to_thread(s3_client.head_object, Bucket=bucket, Key=s3_key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    async def delete_objects(self, s3_keys: List[str]) -> None:
+        """
+        업로드했지만 DB 에 등록하지 못한 객체를 지운다 (고아 객체 정리).
+        실패해도 예외를 올리지 않는다 (원래 오류를 가리지 않도록).
+        """
+        bucket = os.getenv("AWS_S3_BUCKET")
+        for start in range(0, len(s3_keys), S3_DELETE_BATCH):
+            batch = s3_keys[start:start + S3_DELETE_BATCH]
+            try:
+                response = await asyncio.to_thread(
+                    s3_client.delete_objects,
+                    Bucket=bucket,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+            except Exception as e:
+                print(f"[WARN] S3 cleanup failed for {len(batch)} objects: {e}")
+                continue
+            for error in response.get("Errors", []):
+                print(f"[WARN] S3 cleanup failed: {error.get('Key')}: {error.get('Message')}")
@@ -0,0 +1,24 @@
+import json
+import os
+import zlib
+from typing import Any, Dict, Optional
+
+
+# 분석 결과 JSON 압축 레벨 (parsed_text 가 대부분이라 압축률이 높다)
+DOCUMENT_RESULT_COMPRESS_LEVEL = int(os.getenv("DOCUMENT_RESULT_COMPRESS_LEVEL", "6"))
+
+
+def encode_result(result: Dict[str, Any]) -> tuple[str, bytes, int]:
+    """
+    result dict → (encoding, payload, 압축 전 크기)
+    """
+    raw = json.dumps(result, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+    return "zlib", zlib.compress(raw, DOCUMENT_RESULT_COMPRESS_LEVEL), len(raw)
+
+
+def decode_result(encoding: str, payload: bytes) -> Optional[Dict[str, Any]]:
+    if payload is None:
+        return None
+    if encoding == "zlib":
+        payload = zlib.decompress(payload)
+    return json.loads(payload)
@@ -0,0 +1,180 @@
+"""
+documents 스키마 마이그레이션 + document_results 백필.
+
+create_all 은 이미 있는 테이블에 컬럼/인덱스를 추가하지 않으므로, 기존 DB 는 배포 전에 한 번 실행한다.
+여러 번 실행해도 안전하다. (이미 있는 컬럼/인덱스/결과 행은 건너뛴다)
+
+1. documents 에 빠진 컬럼(content_hash, status, version 등)과 인덱스를 추가
+   (더 이상 쓰지 않는 인덱스는 삭제)
+2. document_results 테이블 생성
+3. documents.result(JSON) → document_results 로 압축 복사
+   (분석 전 문서는 result 가 SQL NULL 이 아니라 JSON 'null' 로 저장돼 있으므로 디코딩 후 None 이면 건너뛴다)
+   (status 컬럼을 이번에 추가했거나 --fill-status 를 준 경우 결과 내용으로 상태를 채운다:
+    error → failed, progress → processing, 그 외 결과 있음 → completed)
+4. --drop-legacy-column 을 주면 documents.result 컬럼 삭제 (백필 확인 후에만)
+
+    python -m migrations.documents_schema_migration --dry-run
+    python -m migrations.documents_schema_migration
+    python -m migrations.documents_schema_migration --drop-legacy-column
+"""
+
+import argparse
+import json
+
+from sqlalchemy import MetaData, Table, inspect, insert, select, text, update
+from sqlalchemy.schema import CreateIndex
+
+from config.database.session import engine
+from documents.infrastructure.orm.document_orm import DocumentORM
+from documents.infrastructure.orm.document_result_orm import DocumentResultORM
+from documents.infrastructure.repository.result_codec import encode_result
+
+LEGACY_RESULT_COLUMN = "result"
+# 이전 버전이 만들었지만 어떤 조회도 쓰지 않는 인덱스 (매 결과 갱신마다 updated_at 변경으로 쓰기 비용만 든다)
+OBSOLETE_INDEXES = ("ix_documents_status_updated_at",)
+
+
+def _column_ddl(column, dialect) -> str:
+    ddl = f"{column.name} {column.type.compile(dialect=dialect)}"
+    default = getattr(column.default, "arg", None)
+    if isinstance(default, str):
+        ddl += f" DEFAULT '{default}'"
+    elif isinstance(default, int):
+        ddl += f" DEFAULT {default}"
+    if not column.nullable and isinstance(default, (str, int)):
+        ddl += " NOT NULL"
+    return ddl
+
+
+def migrate_schema(conn, dry_run: bool) -> set[str]:
+    """
+    빠진 컬럼/인덱스/테이블을 만든다. 이번에 추가한 컬럼 이름을 돌려준다.
+    """
+    inspector = inspect(conn)
+    table = DocumentORM.__table__
+    existing_columns = {c["name"] for c in inspector.get_columns(table.name)}
+    existing_indexes = {i["name"] for i in inspector.get_indexes(table.name)}
+
+    statements = []
+    added = set()
+    for column in table.columns:
+        if column.name not in existing_columns:
+            statements.append(f"ALTER TABLE {table.name} ADD COLUMN {_column_ddl(column, conn.dialect)}")
+            added.add(column.name)
+    for index in table.indexes:
+        if index.name not in existing_indexes:
+            statements.append(str(CreateIndex(index).compile(dialect=conn.dialect)))
+    for name in OBSOLETE_INDEXES:
+        if name in existing_indexes:
+            on_table = f" ON {table.name}" if conn.dialect.name == "mysql" else ""
+            statements.append(f"DROP INDEX {name}{on_table}")
+
+    for statement in statements:
+        print(f"[schema] {statement}")
+        if not dry_run:
+            conn.execute(text(statement))
+
+    if not inspector.has_table(DocumentResultORM.__tablename__):
+        print(f"[schema] CREATE TABLE {DocumentResultORM.__tablename__}")
+        if not dry_run:
+            DocumentResultORM.__table__.create(conn)
+    return added
+
+
+def _derive_status(result) -> str:
+    if not isinstance(result, dict):
+        return "completed"
+    if "error" in result:
+        return "failed"
+    if "progress" in result:
+        return "processing"
+    return "completed"
+
+
+def backfill_results(conn, batch_size: int, fill_status: bool, dry_run: bool) -> None:
+    legacy = Table(DocumentORM.__tablename__, MetaData(), autoload_with=conn)
+    if LEGACY_RESULT_COLUMN not in legacy.c:
+        print("[backfill] documents.result 컬럼이 없어 건너뜀")
+        return
+
+    results = DocumentResultORM.__table__
+    # --dry-run 에서는 document_results 가 아직 없을 수 있다
+    has_results_table = inspect(conn).has_table(results.name)
+    copied = skipped = empty = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            select(legacy.c.id, legacy.c[LEGACY_RESULT_COLUMN])
+            .where(legacy.c.id > last_id, legacy.c[LEGACY_RESULT_COLUMN].is_not(None))
+            .order_by(legacy.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        ids = [row.id for row in rows]
+        already = set()
+        if has_results_table:
+            already = set(conn.scalars(select(results.c.document_id).where(results.c.document_id.in_(ids))))
+        batch = []
+        by_status: dict[str, list[int]] = {}
+        for row in rows:
+            result = row[1]
+            if isinstance(result, (str, bytes)):
+                result = json.loads(result)
+            if result is None:
+                # result=None 으로 저장된 분석 전 문서 (JSON 'null'). 결과 행도 상태 변경도 없다
+                empty += 1
+                continue
+            by_status.setdefault(_derive_status(result), []).append(row.id)
+            if row.id in already:
+                skipped += 1
+                continue
+            encoding, payload, raw_size = encode_result(result)
+            batch.append(dict(document_id=row.id, encoding=encoding, payload=payload, raw_size=raw_size))
+
+        if fill_status and not dry_run:
+            for status, status_ids in by_status.items():
+                conn.execute(update(legacy).where(legacy.c.id.in_(status_ids)).values(status=status))
+        if batch and not dry_run:
+            conn.execute(insert(results), batch)
+        copied += len(batch)
+        if not dry_run:
+            conn.commit()
+        print(f"[backfill] up to id={last_id}: copied={copied} skipped={skipped} empty={empty}")
+
+    print(f"[backfill] done: copied={copied} skipped={skipped} empty={empty}")
+
+
+def drop_legacy_column(conn, dry_run: bool) -> None:
+    columns = {c["name"] for c in inspect(conn).get_columns(DocumentORM.__tablename__)}
+    if LEGACY_RESULT_COLUMN not in columns:
+        return
+    statement = f"ALTER TABLE {DocumentORM.__tablename__} DROP COLUMN {LEGACY_RESULT_COLUMN}"
+    print(f"[schema] {statement}")
+    if not dry_run:
+        conn.execute(text(statement))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true", help="실행할 DDL 과 백필 대상만 출력")
+    parser.add_argument("--fill-status", action="store_true", help="status 컬럼이 이미 있어도 결과로부터 다시 채움")
+    parser.add_argument("--drop-legacy-column", action="store_true")
+    args = parser.parse_args()
+
+    with engine.connect() as conn:
+        added = migrate_schema(conn, args.dry_run)
+        if not args.dry_run:
+            conn.commit()
+        backfill_results(conn, args.batch_size, fill_status=args.fill_status or "status" in added, dry_run=args.dry_run)
+        if args.drop_legacy_column:
+            drop_legacy_column(conn, args.dry_run)
+            if not args.dry_run:
+                conn.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,78 +1,149 @@
-from urllib.parse import urlparse
-
-import boto3
 from botocore.exceptions import NoCredentialsError
-from fastapi import APIRouter, Form, HTTPException
+from fastapi import APIRouter, Form, HTTPException, Response, status
 from fastapi.params import Depends
-from fastapi.responses import JSONResponse
-from openai import OpenAI
-from pypdf import PdfReader
+from fastapi.responses import ORJSONResponse, StreamingResponse
 import asyncio
-import io
-import re
-from typing import List
-
-from account.adapter.input.web.session_helper import get_current_user
+import os
+import json
 
-pdf_analyzer_router = APIRouter(tags=["pdf-analyzer"])
+import orjson
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
 
-client = OpenAI()
-
-# PDF 텍스트 추출
-def extract_text_from_pdf_clean(file_bytes: bytes) -> str:
+from account.adapter.input.web.session_helper import get_current_user
+from documents.infrastructure.cache.document_cache import DocumentCache
+from documents.infrastructure.repository.async_document_repository_impl import AsyncDocumentRepositoryImpl
+from pdf_analyzer.adapter.input.web.request.ask_questions_request import AskQuestionsRequest
+from pdf_analyzer.application.chunking.text_chunker import chunk_text, count_tokens, group_by_token_budget
+from pdf_analyzer.application.pipeline.stage_pipeline import Stage, StageListener, StagePipeline
+from pdf_analyzer.application.usecase.analysis_job_usecase import AnalysisJobUseCase, JobQueueFullError
+from pdf_analyzer.infrastucture.cache.pdf_analysis_cache import PdfAnalysisCache
+from pdf_analyzer.infrastucture.extractor.pdf_text_extractor import (
+    PdfExtractionError,
+    PdfExtractionTimeoutError,
+    PdfTooLargeError,
+    extract_text,
+)
+from pdf_analyzer.infrastucture.job.analysis_job_store import AnalysisJobStore
+from pdf_analyzer.infrastucture.llm.llm_gateway import LLMGateway
+from pdf_analyzer.infrastucture.storage.s3_object_downloader import (
+    DownloadedObject,
+    S3ObjectNotFoundError,
+    download_object,
+    head_object,
+    resolve_s3_location,
+)
+
+pdf_analyzer_router = APIRouter(tags=["pdf-analyzer"], default_response_class=ORJSONResponse)
+
+llm_gateway = LLMGateway.getInstance()
+
+# 청크 요약(map) 단계 동시 실행 수 / 청크별 재시도 횟수
+# (429/5xx 같은 일시 오류는 LLM 게이트웨이가 먼저 재시도하므로 여기서는 한 번만)
+SUMMARY_MAP_CONCURRENCY = int(os.getenv("PDF_ANALYZER_MAP_CONCURRENCY", "8"))
+SUMMARY_MAP_MAX_RETRIES = int(os.getenv("PDF_ANALYZER_MAP_MAX_RETRIES", "1"))
+# reduce 호출 하나에 넣을 요약문 토큰 예산 / 한 번에 묶을 최대 요약 수
+SUMMARY_REDUCE_INPUT_TOKENS = int(os.getenv("PDF_ANALYZER_REDUCE_INPUT_TOKENS", "6000"))
+SUMMARY_REDUCE_GROUP_SIZE = int(os.getenv("PDF_ANALYZER_REDUCE_GROUP_SIZE", "8"))
+
+# 프롬프트/모델을 바꾸면 올려서 이전 캐시 결과를 무효화
+PROMPT_VERSION = "v2"
+
+analysis_cache = PdfAnalysisCache.getInstance()
+
+# PDF 텍스트 추출 (프로세스 풀에서 페이지 구간별 병렬 처리)
+async def extract_text_from_pdf_clean(source: bytes | str) -> str:
     try:
-        reader = PdfReader(io.BytesIO(file_bytes))
-        texts = []
-        for page in reader.pages:
-            t = page.extract_text() or ""
-            t = re.sub(r'\s+', ' ', t)                # 공백 정리
-            t = re.sub(r'\d+\s*$', '', t)            # 페이지 번호 제거
-            if t.strip():
-                texts.append(t.strip())
-        return "\n".join(texts)
-    except Exception as e:
+        return await extract_text(source)
+    except PdfTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except PdfExtractionTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except PdfExtractionError as e:
         raise HTTPException(status_code=400, detail=f"PDF parsing error: {str(e)}")
 
-# 텍스트 청킹
-def chunk_text(text: str, chunk_size=3500, overlap=300) -> List[str]:
-    paragraphs = [p.strip() for p in text.split("\n") if p.strip()]
-    chunks, cur = [], ""
-    for p in paragraphs:
-        if len(cur) + len(p) <= chunk_size:
-            cur += " " + p
-        else:
-            chunks.append(cur.strip())
-            cur = p
-    if cur:
-        chunks.append(cur.strip())
-    return chunks
-
-# GPT 호출 래퍼
+# GPT 호출 래퍼 (LLM 게이트웨이 경유: 커넥션 풀 / 재시도 / 분당 한도 / 사용량 집계)
 async def ask_gpt(prompt: str, max_tokens=500):
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, lambda:
-        client.chat.completions.create(
-            model="gpt-4.1",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=max_tokens,
-            temperature=0
-        ).choices[0].message.content
-    )
+    return await llm_gateway.complete(prompt, max_tokens=max_tokens)
 
-# 문서 요약 에이전트 (섹션 요약 후 전체 요약)
-async def summarize_document(chunks: List[str]) -> str:
-    partial_summaries = []
+# GPT 스트리밍 호출 래퍼: 생성되는 토큰 조각을 순서대로 내보낸다
+async def ask_gpt_stream(prompt: str, max_tokens=500) -> AsyncIterator[str]:
+    async for delta in llm_gateway.stream(prompt, max_tokens=max_tokens):
+        yield delta
 
-    for idx, chunk in enumerate(chunks):
-        # 1. 섹션 요약 프롬프트 수정
-        prompt = f"""
+# 섹션(청크) 요약 - 실패 시 지수 백오프로 재시도, 끝내 실패하면 None
+async def summarize_chunk(idx: int, chunk: str) -> Optional[str]:
+    # 1. 섹션 요약 프롬프트 수정
+    prompt = f"""
 다음은 뉴스 기사의 일부 문단이다. 이 문단의 **핵심 사실(육하원칙)**과 **주요 주장**을 간결하게 요약해라.
 
 문단({idx+1}):
 {chunk}
 """
-        summary = await ask_gpt(prompt, max_tokens=400)
-        partial_summaries.append(summary)
+    for attempt in range(SUMMARY_MAP_MAX_RETRIES + 1):
+        try:
+            return await ask_gpt(prompt, max_tokens=400)
+        except Exception as e:
+            print(f"[WARN] chunk {idx+1} summary failed (attempt {attempt+1}): {type(e).__name__}: {e}")
+            if attempt < SUMMARY_MAP_MAX_RETRIES:
+                await asyncio.sleep(0.5 * (2 ** attempt))
+    return None
+
+# map 단계: 청크 요약을 동시 실행 수 제한 하에 병렬로 수행 (결과는 원래 청크 순서 유지)
+async def summarize_chunks(
+        chunks: List[str],
+        concurrency: int | None = None,
+        on_summary: Callable[[int, Optional[str]], Awaitable[None]] | None = None,
+) -> List[Optional[str]]:
+    semaphore = asyncio.Semaphore(max(1, concurrency or SUMMARY_MAP_CONCURRENCY))
+
+    async def run(idx: int, chunk: str) -> Optional[str]:
+        async with semaphore:
+            summary = await summarize_chunk(idx, chunk)
+        if on_summary is not None:
+            await on_summary(idx, summary)
+        return summary
+
+    return await asyncio.gather(*(run(idx, chunk) for idx, chunk in enumerate(chunks)))
+
+# 연속된 섹션 요약 묶음을 하나의 섹션 요약으로 압축 (중간 reduce)
+async def merge_summary_group(summaries: List[str]) -> str:
+    merged = "\n".join(summaries)
+    prompt = f"""
+다음은 뉴스 기사의 연속된 여러 섹션 요약이다. **핵심 사실(육하원칙)**과 **주요 주장**을 빠뜨리지 말고 하나의 섹션 요약으로 간결하게 압축해라.
+
+내용:
+{merged}
+"""
+    return (await ask_gpt(prompt, max_tokens=500)).strip()
+
+# 섹션 요약들을 하나의 기사 요약으로 통합 (reduce)
+# 요약문 합계가 토큰 예산을 넘으면 묶음 단위로 압축을 반복(트리 reduce)해 모든 호출을 예산 안에 둔다
+# on_token 을 주면 최종 요약을 스트리밍으로 생성하며 토큰 조각마다 호출한다
+async def reduce_summaries(
+        chunk_summaries: List[Optional[str]],
+        on_token: Callable[[str], Awaitable[None]] | None = None,
+) -> str:
+    # 실패한 청크는 제외하고 나머지로 전체 요약 진행
+    partial_summaries = [s for s in chunk_summaries if s]
+    if not partial_summaries:
+        raise RuntimeError("All chunk summaries failed")
+
+    semaphore = asyncio.Semaphore(max(1, SUMMARY_MAP_CONCURRENCY))
+
+    async def merge(group: List[str]) -> str:
+        if len(group) == 1:
+            return group[0]
+        async with semaphore:
+            return await merge_summary_group(group)
+
+    while (
+        len(partial_summaries) > SUMMARY_REDUCE_GROUP_SIZE
+        or count_tokens("\n".join(partial_summaries)) > SUMMARY_REDUCE_INPUT_TOKENS
+    ) and len(partial_summaries) > 1:
+        groups = group_by_token_budget(
+            partial_summaries, SUMMARY_REDUCE_INPUT_TOKENS, SUMMARY_REDUCE_GROUP_SIZE
+        )
+        partial_summaries = list(await asyncio.gather(*(merge(g) for g in groups)))
 
     merged = "\n".join(partial_summaries)
 
@@ -87,8 +158,19 @@ async def summarize_document(chunks: List[str]) -> str:
 1.  **제목 (Headline):** 뉴스 기사의 핵심을 담은 한 문장 제목.
 2.  **본문 (Summary):** 누가, 언제, 어디서, 무엇을, 왜, 어떻게 했는지(육하원칙)를 포함하는 2~3문단의 통합 요약.
 """
-    final_summary = await ask_gpt(final_prompt, max_tokens=500)
-    return final_summary.strip()
+    if on_token is None:
+        final_summary = await ask_gpt(final_prompt, max_tokens=500)
+        return final_summary.strip()
+
+    parts = []
+    async for delta in ask_gpt_stream(final_prompt, max_tokens=500):
+        parts.append(delta)
+        await on_token(delta)
+    return "".join(parts).strip()
+
+# 문서 요약 에이전트 (섹션 요약 후 전체 요약)
+async def summarize_document(chunks: List[str]) -> str:
+    return await reduce_summaries(await summarize_chunks(chunks))
 
 # QA 에이전트 (프롬프트 규칙 강화)
 async def qa_on_document(summary: str, question: str) -> str:
@@ -108,6 +190,43 @@ async def qa_on_document(summary: str, question: str) -> str:
 """
     return (await ask_gpt(prompt, max_tokens=300)).strip()
 
+# 배치 QA 에이전트: 여러 질문을 한 번의 호출로 답변
+async def qa_batch_on_document(summary: str, questions: List[str]) -> List[str]:
+    if len(questions) == 1:
+        return [await qa_on_document(summary, questions[0])]
+
+    numbered = "\n".join(f"{i+1}. {q}" for i, q in enumerate(questions))
+    prompt = f"""
+다음은 뉴스 기사의 요약이다. 이 요약 내의 정보만 사용하여 아래 질문들에 각각 답해라.
+
+요약:
+{summary}
+
+질문:
+{numbered}
+
+규칙:
+- **정보 출처 명확화:** 질문에 대한 답을 요약 내에서 찾아라.
+- **추론 금지:** 요약문에 없는 내용은 절대 추론하여 답하지 말 것.
+- **답변 불가 시:** 없으면 "뉴스 요약에 해당 정보가 명시되어 있지 않습니다."라고 답해라.
+
+출력 형식(JSON, 질문 순서와 개수를 그대로 유지):
+{{
+    "answers": ["1번 질문에 대한 답", "2번 질문에 대한 답", ...]
+}}
+"""
+    raw = await ask_gpt(prompt, max_tokens=min(300 * len(questions), 2000))
+
+    try:
+        answers = json.loads(raw)["answers"]
+        if isinstance(answers, list) and len(answers) == len(questions):
+            return [str(a).strip() for a in answers]
+    except (ValueError, KeyError, TypeError):
+        pass
+
+    # 형식이 어긋나면 질문별로 개별 호출
+    return list(await asyncio.gather(*(qa_on_document(summary, q) for q in questions)))
+
 # 감성 분석 + 키포인트 에이전트 (뉴스에 맞게 키포인트 정의 변경)
 async def analyze_opinions(summary: str) -> dict:
     prompt = f"""
@@ -136,55 +255,381 @@ async def analyze_opinions(summary: str) -> dict:
     except:
         return {"sentiment": "unknown", "key_actors": [], "key_issues": []}
 
+# ---- 분석 파이프라인 스테이지 ----
+# 캐시 엔트리에 이미 있는 출력은 다시 계산하지 않는다.
+
+async def _stage_head(ctx: dict) -> dict:
+    head = await head_object(ctx["bucket_name"], ctx["object_key"])
+    if not head.get("ContentLength"):
+        raise HTTPException(400, "Empty file upload")
+    return head
+
+async def _stage_cache(ctx: dict) -> dict:
+    # 같은 PDF(ETag) + 같은 프롬프트 버전이면 캐시된 분석 결과 재사용 (다운로드/LLM 호출 생략)
+    key = analysis_cache.make_key(PROMPT_VERSION, etag=ctx["head"]["ETag"])
+    entry = await analysis_cache.get(key) or {}
+    if _is_degraded(entry.get("chunk_summaries")):
+        # 이전 버전이 저장한 실패 청크 포함 결과는 다시 계산한다
+        entry = {k: v for k, v in entry.items() if k not in DEGRADED_ANALYSIS_OUTPUTS}
+    return {"key": key, "entry": entry}
+
+async def _stage_download(ctx: dict) -> Optional[DownloadedObject]:
+    if "parsed_text" in ctx["cache"]["entry"]:
+        return None
+    return await download_object(ctx["bucket_name"], ctx["object_key"], head=ctx["head"])
+
+async def _stage_extract(ctx: dict) -> str:
+    entry = ctx["cache"]["entry"]
+    if "parsed_text" in entry:
+        return entry["parsed_text"]
+
+    with ctx["download"] as pdf:
+        text = await extract_text_from_pdf_clean(pdf.source)
+    if not text:
+        raise HTTPException(400, "No text extracted")
+    return text
+
+async def _stage_chunk(ctx: dict) -> Optional[List[str]]:
+    if "chunk_summaries" in ctx["cache"]["entry"]:
+        return None
+
+    chunks = chunk_text(ctx["extract"])
+    if not chunks:
+        raise HTTPException(500, "Chunking failed")
+    return chunks
+
+async def _stage_map_summarize(ctx: dict) -> List[Optional[str]]:
+    entry = ctx["cache"]["entry"]
+    if "chunk_summaries" in entry:
+        return entry["chunk_summaries"]
+    return await summarize_chunks(ctx["chunk"], on_summary=ctx.get("on_chunk_summary"))
+
+async def _stage_reduce(ctx: dict) -> str:
+    entry = ctx["cache"]["entry"]
+    if "summary" in entry:
+        return entry["summary"]
+    return await reduce_summaries(ctx["map_summarize"], on_token=ctx.get("on_summary_token"))
+
+async def _stage_qa(ctx: dict) -> str:
+    # QA는 질문별로 캐시
+    key, question = ctx["cache"]["key"], ctx["question"]
+    answer = await analysis_cache.get_answer(key, question)
+    if answer is None:
+        answer = await qa_on_document(ctx["reduce"], question)
+        await analysis_cache.set_answer(key, question, answer)
+    return answer
+
+async def _stage_sentiment(ctx: dict) -> dict:
+    entry = ctx["cache"]["entry"]
+    if "analysis" in entry:
+        return entry["analysis"]
+    return await analyze_opinions(ctx["reduce"])
+
+# 다운로드 → 추출 → 청킹 → 청크 요약(map) → 통합 요약(reduce) → (QA | 감성 분석)
+analysis_pipeline = StagePipeline([
+    Stage("head", _stage_head),
+    Stage("cache", _stage_cache, depends_on=["head"]),
+    Stage("download", _stage_download, depends_on=["head", "cache"]),
+    Stage("extract", _stage_extract, depends_on=["download"]),
+    Stage("chunk", _stage_chunk, depends_on=["extract"]),
+    Stage("map_summarize", _stage_map_summarize, depends_on=["chunk"]),
+    Stage("reduce", _stage_reduce, depends_on=["map_summarize"]),
+    Stage("qa", _stage_qa, depends_on=["reduce"]),
+    Stage("sentiment", _stage_sentiment, depends_on=["reduce"]),
+])
+
+# 응답 필드 → 이를 만드는 스테이지
+ANALYSIS_OUTPUTS = {
+    "parsed_text": "extract",
+    "chunk_summaries": "map_summarize",
+    "summary": "reduce",
+    "answer": "qa",
+    "analysis": "sentiment",
+}
+DEFAULT_ANALYSIS_OUTPUTS = ("parsed_text", "summary", "answer", "analysis")
+# 캐시 엔트리에 저장하는 필드 (answer는 질문별 해시에 따로 저장)
+CACHED_ANALYSIS_OUTPUTS = ("parsed_text", "chunk_summaries", "summary", "analysis")
+# 청크 요약이 하나라도 실패(None)했을 때 캐시하지 않는 필드 (일시적 LLM 장애 결과를 TTL 동안 고정하지 않도록)
+DEGRADED_ANALYSIS_OUTPUTS = ("chunk_summaries", "summary", "analysis")
+
+def _is_degraded(chunk_summaries: List[Optional[str]] | None) -> bool:
+    return chunk_summaries is not None and any(s is None for s in chunk_summaries)
+
+def parse_analysis_outputs(raw: str | None) -> List[str]:
+    if not raw:
+        return list(DEFAULT_ANALYSIS_OUTPUTS)
+    outputs = [o.strip() for o in raw.split(",") if o.strip()]
+    unknown = [o for o in outputs if o not in ANALYSIS_OUTPUTS]
+    if unknown or not outputs:
+        raise ValueError(
+            f"Unknown outputs: {unknown}. Available: {', '.join(ANALYSIS_OUTPUTS)}"
+        )
+    return outputs
+
+# 분석 파이프라인 실행: 요청한 출력에 필요한 스테이지만 실행하고, 독립 스테이지는 동시에 실행
+async def run_analysis(
+        bucket_name: str,
+        object_key: str,
+        question: str | None,
+        on_progress: Callable[[str], Awaitable[None]] | None = None,
+        outputs: List[str] | None = None,
+        on_stage: StageListener | None = None,
+        on_chunk_summary: Callable[[int, Optional[str]], Awaitable[None]] | None = None,
+        on_summary_token: Callable[[str], Awaitable[None]] | None = None,
+) -> dict:
+    outputs = list(outputs or DEFAULT_ANALYSIS_OUTPUTS)
+    if "answer" in outputs and not question:
+        raise HTTPException(400, "question is required for the 'answer' output")
+
+    async def listener(stage: str, event: str, output) -> None:
+        if on_progress is not None and event == "started":
+            await on_progress(stage)
+        if on_stage is not None:
+            await on_stage(stage, event, output)
+
+    run = analysis_pipeline.new_run(
+        {
+            "bucket_name": bucket_name,
+            "object_key": object_key,
+            "question": question,
+            "on_chunk_summary": on_chunk_summary,
+            "on_summary_token": on_summary_token,
+        },
+        listener,
+    )
+    try:
+        await run.execute([ANALYSIS_OUTPUTS[o] for o in outputs])
+    finally:
+        downloaded = run.outputs.get("download")
+        if downloaded is not None:
+            downloaded.close()
+
+    # 새로 계산한 출력만 캐시 엔트리에 병합
+    cache = run.outputs["cache"]
+    entry = dict(cache["entry"])
+    degraded = _is_degraded(run.outputs.get("map_summarize"))
+    for name in CACHED_ANALYSIS_OUTPUTS:
+        stage = ANALYSIS_OUTPUTS[name]
+        if degraded and name in DEGRADED_ANALYSIS_OUTPUTS:
+            continue
+        if name not in entry and stage in run.outputs:
+            entry[name] = run.outputs[stage]
+    if entry != cache["entry"]:
+        await analysis_cache.set(cache["key"], entry)
+
+    result = {name: run.outputs[ANALYSIS_OUTPUTS[name]] for name in outputs}
+    result["stage_durations_ms"] = run.durations
+    return result
+
+# 작업 모드에서 documents.s3_key 기준으로 파이프라인 실행
+async def run_document_analysis(
+        s3_key: str,
+        question: str,
+        on_progress: Callable[[str], Awaitable[None]] | None = None,
+) -> dict:
+    bucket_name, object_key = resolve_s3_location(s3_key=s3_key)
+    return await run_analysis(bucket_name, object_key, question, on_progress)
+
+document_repository = AsyncDocumentRepositoryImpl.getInstance()
+
+analysis_job_usecase = AnalysisJobUseCase(
+    document_repository,
+    AnalysisJobStore.getInstance(),
+    run_document_analysis,
+    document_cache=DocumentCache.getInstance(),
+)
+
 @pdf_analyzer_router.post("/analyze")
 async def analyze_document(
-        file_url: str = Form(...),
-        question: str = Form(...),
+        response: Response,
+        file_url: str | None = Form(None),
+        question: str | None = Form(None),
+        s3_key: str | None = Form(None),
+        outputs: str | None = Form(None),
         user_id: int = Depends(get_current_user)
 ):
+    """
+    outputs: 필요한 결과만 쉼표로 지정 (예: "analysis" → 감성 분석만)
+    가능한 값: parsed_text, chunk_summaries, summary, answer, analysis
+    기본값: parsed_text, summary, answer, analysis
+    """
     try:
-        content = download_s3_file(file_url)
-        if not content:
-            raise HTTPException(400, "Empty file upload")
-
-        text = extract_text_from_pdf_clean(content)
-        if not text:
-            raise HTTPException(400, "No text extracted")
-
-        chunks = chunk_text(text)
-        if not chunks:
-            raise HTTPException(500, "Chunking failed")
-
-        # 1. 요약
-        summary = await summarize_document(chunks)
+        try:
+            bucket_name, object_key = resolve_s3_location(file_url, s3_key)
+            requested = parse_analysis_outputs(outputs)
+        except ValueError as e:
+            raise HTTPException(400, str(e))
+
+        result = ORJSONResponse(
+            await run_analysis(bucket_name, object_key, question, outputs=requested)
+        )
+        # get_current_user 가 갱신한 세션 쿠키를 유지
+        result.headers.raw.extend(response.headers.raw)
+        return result
 
-        # 2. QA
-        answer = await qa_on_document(summary, question)
+    except HTTPException:
+        raise
+    except NoCredentialsError:
+        raise HTTPException(500, "AWS credentials not available.")
+    except S3ObjectNotFoundError:
+        raise HTTPException(404, "File not found in S3.")
+    except Exception as e:
+        raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
-        # 3. 감성 분석 + 키포인트
-        analysis = await analyze_opinions(summary)
+# SSE 이벤트 한 건 직렬화
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+# 완료 시 결과를 이벤트로 내보낼 스테이지: 스테이지 → 이벤트(필드) 이름
+STREAMED_STAGE_RESULTS = {
+    "reduce": "summary",
+    "qa": "answer",
+    "sentiment": "analysis",
+}
+
+@pdf_analyzer_router.post("/analyze/stream")
+async def analyze_document_stream(
+        response: Response,
+        file_url: str | None = Form(None),
+        question: str | None = Form(None),
+        s3_key: str | None = Form(None),
+        outputs: str | None = Form(None),
+        user_id: int = Depends(get_current_user)
+):
+    """
+    /analyze 의 Server-Sent Events 버전.
+    이벤트: stage(진행 단계), chunk_summary(청크 요약 완료), summary_token(최종 요약 토큰),
+    summary / answer / analysis(결과), done(스테이지별 소요 시간), error
+    """
+    try:
+        bucket_name, object_key = resolve_s3_location(file_url, s3_key)
+        requested = parse_analysis_outputs(outputs)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    if "answer" in requested and not question:
+        raise HTTPException(400, "question is required for the 'answer' output")
+
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+
+    async def on_stage(stage: str, event: str, output) -> None:
+        await queue.put(_sse("stage", {"stage": stage, "status": event}))
+        if event == "completed" and stage in STREAMED_STAGE_RESULTS:
+            name = STREAMED_STAGE_RESULTS[stage]
+            await queue.put(_sse(name, {name: output}))
+
+    async def on_chunk_summary(idx: int, summary: Optional[str]) -> None:
+        await queue.put(_sse("chunk_summary", {"index": idx, "summary": summary}))
+
+    async def on_summary_token(delta: str) -> None:
+        await queue.put(_sse("summary_token", {"text": delta}))
+
+    async def produce() -> None:
+        try:
+            result = await run_analysis(
+                bucket_name,
+                object_key,
+                question,
+                outputs=requested,
+                on_stage=on_stage,
+                on_chunk_summary=on_chunk_summary,
+                on_summary_token=on_summary_token,
+            )
+            await queue.put(_sse("done", {"stage_durations_ms": result["stage_durations_ms"]}))
+        except HTTPException as e:
+            await queue.put(_sse("error", {"status_code": e.status_code, "detail": e.detail}))
+        except S3ObjectNotFoundError:
+            await queue.put(_sse("error", {"status_code": 404, "detail": "File not found in S3."}))
+        except Exception as e:
+            await queue.put(_sse("error", {"status_code": 500, "detail": f"{type(e).__name__}: {str(e)}"}))
+        finally:
+            await queue.put(done)
+
+    async def event_stream():
+        task = asyncio.create_task(produce())
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                yield item
+        finally:
+            # 클라이언트 연결이 끊기면 파이프라인도 중단
+            if not task.done():
+                task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    result = StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+    # get_current_user 가 갱신한 세션 쿠키를 유지
+    result.headers.raw.extend(response.headers.raw)
+    return result
 
-        return JSONResponse({
-            "parsed_text": text,
-            "summary": summary,
-            "answer": answer,
-            "analysis": analysis
-        })
+@pdf_analyzer_router.post("/jobs", status_code=status.HTTP_202_ACCEPTED)
+async def submit_analysis_job(
+        document_id: int = Form(...),
+        question: str = Form(...),
+        user_id: int = Depends(get_current_user)
+):
+    """
+    분석 작업을 큐에 넣고 job_id를 바로 반환한다.
+    진행 상황과 결과는 document_results / documents.status 에 기록되며
+    GET /pdf-analyzer/jobs/{job_id} 로 조회할 수 있다.
+    """
+    try:
+        return await analysis_job_usecase.submit(document_id, question, user_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Document not found")
+    except JobQueueFullError:
+        raise HTTPException(status_code=503, detail="Analysis queue is full, please retry later")
+
+@pdf_analyzer_router.get("/jobs/{job_id}")
+async def get_analysis_job(job_id: str, user_id: int = Depends(get_current_user)):
+    job = await analysis_job_usecase.get_job(job_id, user_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@pdf_analyzer_router.post("/documents/{document_id}/questions")
+async def ask_document_questions(
+        document_id: int,
+        payload: AskQuestionsRequest,
+        user_id: int = Depends(get_current_user)
+):
+    """
+    이미 분석이 끝난 문서(document_results 의 summary)를 기준으로 후속 질문에 답한다.
+    PDF 다운로드/파싱/요약은 다시 하지 않고 QA 호출 한 번만 수행한다.
+    """
+    document = await document_repository.find_by_id(document_id, include_result=True)
+    # 다른 사용자의 문서는 없는 것으로 취급
+    if document is None or document.uploader_id != user_id:
+        raise HTTPException(status_code=404, detail="Document not found")
+
+    summary = (document.result or {}).get("summary")
+    if not summary:
+        raise HTTPException(status_code=409, detail="Document analysis is not completed")
+
+    questions = [q.strip() for q in payload.questions if q.strip()]
+    if not questions:
+        raise HTTPException(status_code=400, detail="questions must not be empty")
 
+    try:
+        answers = await qa_batch_on_document(summary, questions)
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
-def download_s3_file(file_url: str) -> bytes:
-    parsed = urlparse(file_url)
-    bucket_name = parsed.netloc.split('.')[0]
-    object_key = parsed.path.lstrip('/')
+    return {
+        "document_id": document_id,
+        "answers": [{"question": q, "answer": a} for q, a in zip(questions, answers)],
+    }
 
-    s3 = boto3.client('s3')
-    try:
-        response = s3.get_object(Bucket=bucket_name, Key=object_key)
-        content = response['Body'].read()
-        return content
-    except NoCredentialsError:
-        raise HTTPException(500, "AWS credentials not available.")
-    except s3.exceptions.NoSuchKey:
-        raise HTTPException(404, "File not found in S3.")
\ No newline at end of file
+@pdf_analyzer_router.get("/cache/stats")
+async def get_cache_stats():
+    return await analysis_cache.stats()
+
+@pdf_analyzer_router.get("/llm/stats")
+async def get_llm_stats():
+    return llm_gateway.stats()
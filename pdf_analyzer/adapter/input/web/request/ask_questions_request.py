@@ -0,0 +1,7 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class AskQuestionsRequest(BaseModel):
+    questions: List[str] = Field(..., min_length=1, max_length=20)
@@ -0,0 +1,157 @@
+import os
+import re
+from functools import lru_cache
+from typing import List
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken 미설치 시 바이트 길이 기반 근사치 사용
+    tiktoken = None
+
+TOKENIZER_MODEL = os.getenv("OPENAI_MODEL", "gpt-4.1")
+# 청크 하나의 토큰 예산 / 인접 청크 간 겹치는 토큰 수
+PDF_CHUNK_TOKENS = int(os.getenv("PDF_CHUNK_TOKENS", "1500"))
+PDF_CHUNK_OVERLAP_TOKENS = int(os.getenv("PDF_CHUNK_OVERLAP_TOKENS", "150"))
+
+# 문장 경계: 마침표/물음표/느낌표(및 "다.") 뒤 공백
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?。])\s+')
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(TOKENIZER_MODEL)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def count_tokens(text: str) -> int:
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    # 근사치: 한글 1글자(3바이트) ≈ 1토큰, 영문 3글자 ≈ 1토큰 (실제보다 크게 잡는 쪽)
+    return (len(text.encode("utf-8")) + 2) // 3
+
+
+def _hard_split(text: str, max_tokens: int) -> List[str]:
+    encoding = _encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text)
+        return [
+            encoding.decode(tokens[i:i + max_tokens]).strip()
+            for i in range(0, len(tokens), max_tokens)
+        ]
+
+    pieces, cur = [], ""
+    for ch in text:
+        if cur and count_tokens(cur + ch) > max_tokens:
+            pieces.append(cur.strip())
+            cur = ""
+        cur += ch
+    if cur.strip():
+        pieces.append(cur.strip())
+    return pieces
+
+
+def _tail(text: str, max_tokens: int) -> str:
+    """text 의 마지막 max_tokens 토큰만큼을 잘라 돌려준다. (청크 간 overlap 용)"""
+    if max_tokens <= 0:
+        return ""
+    encoding = _encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text)
+        # 멀티바이트 문자 중간에서 잘린 앞부분의 깨진 글자는 버린다
+        return encoding.decode(tokens[-max_tokens:]).lstrip("\ufffd").strip()
+
+    budget = max_tokens * 3
+    start = len(text)
+    while start > 0 and budget - len(text[start - 1].encode("utf-8")) >= 0:
+        start -= 1
+        budget -= len(text[start].encode("utf-8"))
+    return text[start:].strip()
+
+
+def _split_units(text: str, max_tokens: int) -> List[str]:
+    """
+    문단 → (너무 길면) 문장 → (그래도 길면) 토큰 단위로 잘라
+    각 조각이 max_tokens 이하가 되도록 만든다.
+    """
+    units: List[str] = []
+    for paragraph in (p.strip() for p in text.split("\n")):
+        if not paragraph:
+            continue
+        if count_tokens(paragraph) <= max_tokens:
+            units.append(paragraph)
+            continue
+        for sentence in _SENTENCE_BOUNDARY.split(paragraph):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            if count_tokens(sentence) <= max_tokens:
+                units.append(sentence)
+            else:
+                units.extend(p for p in _hard_split(sentence, max_tokens) if p)
+    return units
+
+
+def chunk_text(
+    text: str,
+    chunk_tokens: int = PDF_CHUNK_TOKENS,
+    overlap_tokens: int = PDF_CHUNK_OVERLAP_TOKENS,
+) -> List[str]:
+    """
+    토큰 예산 기반 청킹.
+    - 모든 청크는 chunk_tokens 이하
+    - 새 청크는 이전 청크의 마지막 overlap_tokens 토큰으로 시작
+      (페이지처럼 overlap 보다 큰 조각이 경계에 와도 문맥이 이어지도록 조각이 아닌 토큰 단위로 자른다)
+    """
+    overlap_tokens = max(0, min(overlap_tokens, chunk_tokens // 2))
+    units = _split_units(text, max(1, chunk_tokens - overlap_tokens))
+
+    chunks: List[str] = []
+    cur: List[str] = []
+    cur_tokens = 0
+    for unit in units:
+        unit_tokens = count_tokens(unit)
+        # 조각 사이에 붙는 공백 몫으로 1 토큰을 더 잡는다
+        if cur and cur_tokens + 1 + unit_tokens > chunk_tokens:
+            previous = " ".join(cur)
+            chunks.append(previous)
+
+            # 이전 청크 끝부분을 overlap 예산만큼 이어붙여 문맥 유지
+            tail = _tail(previous, min(overlap_tokens, chunk_tokens - unit_tokens - 1))
+            tail_tokens = count_tokens(tail) if tail else 0
+            if tail and tail_tokens + 1 + unit_tokens <= chunk_tokens:
+                cur, cur_tokens = [tail], tail_tokens
+            else:
+                cur, cur_tokens = [], 0
+
+        cur_tokens += unit_tokens + (1 if cur else 0)
+        cur.append(unit)
+
+    if cur:
+        chunks.append(" ".join(cur))
+    return chunks
+
+
+def group_by_token_budget(texts: List[str], max_tokens: int, max_group_size: int) -> List[List[str]]:
+    """
+    순서를 유지한 채 토큰 예산/개수 제한 안에서 텍스트를 묶는다. (계층적 reduce 용)
+    하나의 그룹에는 최소 2개를 넣어 단계마다 개수가 줄어들도록 한다.
+    """
+    max_group_size = max(2, max_group_size)
+    groups: List[List[str]] = []
+    cur: List[str] = []
+    cur_tokens = 0
+    for text in texts:
+        tokens = count_tokens(text)
+        if len(cur) >= 2 and (cur_tokens + tokens > max_tokens or len(cur) >= max_group_size):
+            groups.append(cur)
+            cur, cur_tokens = [], 0
+        cur.append(text)
+        cur_tokens += tokens
+    if cur:
+        groups.append(cur)
+    return groups
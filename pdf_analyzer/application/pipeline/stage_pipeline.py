@@ -0,0 +1,122 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+# 스테이지 함수: 지금까지의 출력(+초기 입력)을 받아 자신의 출력을 반환
+StageFunc = Callable[[Dict[str, Any]], Awaitable[Any]]
+# 스테이지 이벤트 콜백: (stage_name, "started" | "completed", 완료 시 출력)
+StageListener = Callable[[str, str, Any], Awaitable[None]]
+
+
+class Stage:
+    def __init__(self, name: str, func: StageFunc, depends_on: Iterable[str] = ()):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+
+
+class StagePipeline:
+    """
+    스테이지와 의존 관계를 선언하는 작은 DAG 실행기.
+    - 요청한 출력에 필요한 스테이지만 실행
+    - 서로 의존하지 않는 스테이지는 동시에 실행
+    - 스테이지별 소요 시간 기록
+    """
+
+    def __init__(self, stages: List[Stage]):
+        self.stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage: {stage.name}")
+            self.stages[stage.name] = stage
+
+        for stage in stages:
+            for dep in stage.depends_on:
+                if dep not in self.stages:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        visiting, done = set(), set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Cycle detected at stage '{name}'")
+            visiting.add(name)
+            for dep in self.stages[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.stages:
+            visit(name)
+
+    def required_stages(self, targets: Iterable[str]) -> Set[str]:
+        required: Set[str] = set()
+        pending = list(targets)
+        while pending:
+            name = pending.pop()
+            if name not in self.stages:
+                raise ValueError(f"Unknown stage: {name}")
+            if name in required:
+                continue
+            required.add(name)
+            pending.extend(self.stages[name].depends_on)
+        return required
+
+    def new_run(self, inputs: Optional[Dict[str, Any]] = None, listener: Optional[StageListener] = None) -> "PipelineRun":
+        return PipelineRun(self, inputs or {}, listener)
+
+
+class PipelineRun:
+    """
+    파이프라인 1회 실행 상태.
+    실패하더라도 outputs 에는 완료된 스테이지 결과가 남아 있어 호출 측에서 정리할 수 있다.
+    """
+
+    def __init__(self, pipeline: StagePipeline, inputs: Dict[str, Any], listener: Optional[StageListener]):
+        self.pipeline = pipeline
+        self.inputs = dict(inputs)
+        self.outputs: Dict[str, Any] = {}
+        self.durations: Dict[str, float] = {}  # ms
+        self.listener = listener
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    async def _notify(self, name: str, event: str, output: Any = None) -> None:
+        if self.listener is not None:
+            await self.listener(name, event, output)
+
+    def _schedule(self, name: str) -> asyncio.Task:
+        task = self._tasks.get(name)
+        if task is None:
+            task = asyncio.create_task(self._run_stage(name), name=f"stage-{name}")
+            self._tasks[name] = task
+        return task
+
+    async def _run_stage(self, name: str) -> Any:
+        stage = self.pipeline.stages[name]
+        if stage.depends_on:
+            await asyncio.gather(*(self._schedule(dep) for dep in stage.depends_on))
+
+        await self._notify(name, "started")
+        started = time.perf_counter()
+        output = await stage.func({**self.inputs, **self.outputs})
+        self.durations[name] = round((time.perf_counter() - started) * 1000, 1)
+        self.outputs[name] = output
+        await self._notify(name, "completed", output)
+        return output
+
+    async def execute(self, targets: Iterable[str]) -> Dict[str, Any]:
+        targets = list(targets)
+        self.pipeline.required_stages(targets)  # 알 수 없는 스테이지 검증
+        try:
+            await asyncio.gather(*(self._schedule(name) for name in targets))
+        except BaseException:
+            # 하나가 실패하면 나머지 스테이지도 중단
+            for task in self._tasks.values():
+                task.cancel()
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+            raise
+        return {name: self.outputs[name] for name in targets}
@@ -0,0 +1,138 @@
+import asyncio
+import os
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from documents.application.port.async_document_repository_port import AsyncDocumentRepositoryPort
+from documents.application.port.document_cache_port import DocumentCachePort
+from pdf_analyzer.infrastucture.job.analysis_job_store import AnalysisJobStore
+
+# 작업 하나를 처리하는 파이프라인: (s3_key, question, on_progress) -> 분석 결과
+AnalysisPipeline = Callable[[str, str, Callable[[str], Awaitable[None]]], Awaitable[Dict[str, Any]]]
+
+
+class JobQueueFullError(Exception):
+    pass
+
+
+class AnalysisJobUseCase:
+    """
+    PDF 분석 작업 모드.
+    - submit(): 작업을 큐에 넣고 job_id를 즉시 반환 (문서 크기와 무관)
+    - 문서 / 작업은 업로드 / 제출한 사용자만 다룰 수 있다 (그 외에는 없는 것으로 취급)
+    - 프로세스 내 워커 N개가 큐에서 작업을 꺼내 파이프라인 실행
+    - 진행 단계 / 최종 결과는 DocumentRepository.update_result 로 documents 에 기록
+      (status: processing → completed / failed). 기록할 때마다 문서 캐시를 무효화한다
+    """
+
+    def __init__(
+        self,
+        document_repository: AsyncDocumentRepositoryPort,
+        job_store: AnalysisJobStore,
+        pipeline: AnalysisPipeline,
+        workers: int | None = None,
+        queue_size: int | None = None,
+        document_cache: DocumentCachePort | None = None,
+    ) -> None:
+        self.document_repository = document_repository
+        self.document_cache = document_cache
+        self.job_store = job_store
+        self.pipeline = pipeline
+        self.workers = workers or int(os.getenv("PDF_ANALYSIS_JOB_WORKERS", "4"))
+        self.queue_size = queue_size or int(os.getenv("PDF_ANALYSIS_JOB_QUEUE_SIZE", "100"))
+        self._queue: Optional[asyncio.Queue] = None
+        self._reserved = 0  # submit 중 진행 상태 기록을 기다리며 예약해 둔 큐 자리 수
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"pdf-analysis-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._queue = None
+
+    async def submit(self, document_id: int, question: str, user_id: int) -> Dict[str, Any]:
+        await self.start()
+
+        document = await self.document_repository.find_by_id(document_id)
+        if document is None or document.uploader_id != user_id:
+            raise ValueError(f"Document(id={document_id}) not found")
+
+        # 진행 상태를 기록하는 await 동안 다른 요청이 같은 자리를 차지하지 않도록 큐 자리를 먼저 예약한다
+        # (작업을 큐에 바로 넣으면 워커가 "queued" 기록보다 먼저 끝낸 결과를 덮어쓸 수 있음)
+        queue = self._queue
+        if queue.qsize() + self._reserved >= queue.maxsize:
+            raise JobQueueFullError()
+        self._reserved += 1
+        try:
+            job_id = str(uuid.uuid4())
+            job = await self.job_store.create(job_id, document_id, user_id)
+            try:
+                await self._update_document(
+                    document_id,
+                    {"progress": {"job_id": job_id, "stage": "queued"}},
+                    "processing",
+                )
+            except Exception as e:
+                await self.job_store.update(job_id, status="failed", stage="failed", error=f"{type(e).__name__}: {e}")
+                raise
+            queue.put_nowait((job_id, document_id, document.s3_key, question))
+        finally:
+            self._reserved -= 1
+        return job
+
+    async def get_job(self, job_id: str, user_id: int) -> Optional[Dict[str, Any]]:
+        job = await self.job_store.get(job_id)
+        if job is None or job.get("owner_id") != user_id:
+            return None
+        return job
+
+    async def _update_document(self, document_id: int, result: Dict[str, Any], status: str) -> None:
+        try:
+            await self.document_repository.update_result(document_id, result, status)
+        finally:
+            if self.document_cache is not None:
+                await self.document_cache.invalidate(document_id)
+
+    async def _worker(self) -> None:
+        while True:
+            job_id, document_id, s3_key, question = await self._queue.get()
+            try:
+                await self._run(job_id, document_id, s3_key, question)
+            except Exception as e:
+                print(f"[ERROR] analysis job {job_id} crashed: {type(e).__name__}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str, document_id: int, s3_key: str, question: str) -> None:
+        async def on_progress(stage: str) -> None:
+            await self.job_store.update(job_id, status="processing", stage=stage)
+            await self._update_document(
+                document_id,
+                {"progress": {"job_id": job_id, "stage": stage}},
+                "processing",
+            )
+
+        try:
+            result = await self.pipeline(s3_key, question, on_progress)
+        except Exception as e:
+            error = getattr(e, "detail", None) or f"{type(e).__name__}: {e}"
+            await self.job_store.update(job_id, status="failed", stage="failed", error=str(error))
+            await self._update_document(
+                document_id,
+                {"error": str(error), "job_id": job_id},
+                "failed",
+            )
+            return
+
+        await self._update_document(document_id, result, "completed")
+        await self.job_store.update(job_id, status="completed", stage="completed")
@@ -0,0 +1,146 @@
+# pdf_analyzer/infrastucture/cache/pdf_analysis_cache.py
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Optional
+
+import redis
+
+from config.async_redis_config import get_async_redis, redis_pipeline
+
+
+class PdfAnalysisCache:
+    """
+    PDF 분석 결과 캐시 (Redis, 비동기 클라이언트 - 이벤트 루프를 막지 않는다).
+    - 키: PDF 바이트 해시(sha256) 또는 S3 ETag + 프롬프트 버전
+    - 값: 추출 텍스트, 청크 요약, 최종 요약, 감성 분석 결과 (JSON)
+    - 질문별 QA 답변은 별도 해시에 저장
+    - TTL 만료 + 최대 엔트리 수 초과 시 가장 오래 사용되지 않은 엔트리부터 제거
+    - hit / miss / eviction 카운터는 Redis에 누적 (워커 간 공유)
+    """
+
+    KEY_PREFIX = "pdf_analysis"
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.ttl = int(os.getenv("PDF_ANALYSIS_CACHE_TTL", str(24 * 60 * 60)))
+            cls.__instance.max_entries = int(os.getenv("PDF_ANALYSIS_CACHE_MAX_ENTRIES", "500"))
+            cls.__instance.max_entry_bytes = int(os.getenv("PDF_ANALYSIS_CACHE_MAX_ENTRY_BYTES", str(5 * 1024 * 1024)))
+        return cls.__instance
+
+    @classmethod
+    def getInstance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    @staticmethod
+    def make_key(prompt_version: str, content: bytes | None = None, etag: str | None = None) -> str:
+        if etag:
+            digest = "etag:" + etag.strip('"')
+        elif content is not None:
+            digest = f"sha256:{hashlib.sha256(content).hexdigest()}"
+        else:
+            raise ValueError("content 또는 etag 중 하나는 필요합니다")
+        return f"{prompt_version}:{digest}"
+
+    def _entry_key(self, key: str) -> str:
+        return f"{self.KEY_PREFIX}:entry:{key}"
+
+    def _answers_key(self, key: str) -> str:
+        return f"{self.KEY_PREFIX}:answers:{key}"
+
+    @property
+    def _index_key(self) -> str:
+        # 마지막 사용 시각 기준 정렬 집합 (LRU 제거용)
+        return f"{self.KEY_PREFIX}:index"
+
+    async def _incr(self, counter: str, amount: int = 1) -> None:
+        try:
+            await get_async_redis().incrby(f"{self.KEY_PREFIX}:stats:{counter}", amount)
+        except redis.RedisError:
+            pass
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            raw = await get_async_redis().get(self._entry_key(key))
+            async with redis_pipeline() as pipe:
+                if raw is None:
+                    # TTL로 만료된 엔트리가 인덱스에 남아있을 수 있으므로 정리
+                    pipe.zrem(self._index_key, key)
+                    pipe.incrby(f"{self.KEY_PREFIX}:stats:misses", 1)
+                else:
+                    pipe.zadd(self._index_key, {key: time.time()})
+                    pipe.incrby(f"{self.KEY_PREFIX}:stats:hits", 1)
+            return json.loads(raw) if raw is not None else None
+        except (redis.RedisError, json.JSONDecodeError) as e:
+            print(f"[WARN] pdf analysis cache get failed: {e}")
+            await self._incr("misses")
+            return None
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        data = json.dumps(value, ensure_ascii=False)
+        if len(data.encode("utf-8")) > self.max_entry_bytes:
+            # 너무 큰 결과는 캐시하지 않음
+            return
+        try:
+            async with redis_pipeline() as pipe:
+                pipe.set(self._entry_key(key), data, ex=self.ttl)
+                pipe.zadd(self._index_key, {key: time.time()})
+                pipe.zcard(self._index_key)
+                *_, size = await pipe.execute()
+            if size > self.max_entries:
+                await self._evict(size - self.max_entries)
+        except redis.RedisError as e:
+            print(f"[WARN] pdf analysis cache set failed: {e}")
+
+    async def get_answer(self, key: str, question: str) -> Optional[str]:
+        try:
+            return await get_async_redis().hget(self._answers_key(key), self._question_field(question))
+        except redis.RedisError:
+            return None
+
+    async def set_answer(self, key: str, question: str, answer: str) -> None:
+        try:
+            async with redis_pipeline() as pipe:
+                pipe.hset(self._answers_key(key), self._question_field(question), answer)
+                pipe.expire(self._answers_key(key), self.ttl)
+        except redis.RedisError as e:
+            print(f"[WARN] pdf analysis cache set_answer failed: {e}")
+
+    @staticmethod
+    def _question_field(question: str) -> str:
+        return hashlib.sha256(question.strip().encode("utf-8")).hexdigest()
+
+    async def _evict(self, overflow: int) -> None:
+        victims = await get_async_redis().zrange(self._index_key, 0, overflow - 1)
+        if not victims:
+            return
+
+        async with redis_pipeline() as pipe:
+            for victim in victims:
+                pipe.delete(self._entry_key(victim), self._answers_key(victim))
+            pipe.zrem(self._index_key, *victims)
+            pipe.incrby(f"{self.KEY_PREFIX}:stats:evictions", len(victims))
+
+    async def stats(self) -> Dict[str, int]:
+        try:
+            hits, misses, evictions = await get_async_redis().mget(
+                f"{self.KEY_PREFIX}:stats:hits",
+                f"{self.KEY_PREFIX}:stats:misses",
+                f"{self.KEY_PREFIX}:stats:evictions",
+            )
+            entries = await get_async_redis().zcard(self._index_key)
+        except redis.RedisError:
+            return {"hits": 0, "misses": 0, "evictions": 0, "entries": 0}
+
+        return {
+            "hits": int(hits or 0),
+            "misses": int(misses or 0),
+            "evictions": int(evictions or 0),
+            "entries": int(entries or 0),
+        }
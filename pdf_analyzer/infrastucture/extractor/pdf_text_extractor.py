@@ -0,0 +1,160 @@
+# pdf_analyzer/infrastucture/extractor/pdf_text_extractor.py
+
+import asyncio
+import io
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List
+
+from pypdf import PdfReader
+
+# 추출 프로세스 수 / 작업 하나가 담당할 페이지 수 / 문서당 최대 페이지 / 문서당 제한 시간(초)
+PDF_EXTRACT_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", str(min(4, os.cpu_count() or 1))))
+PDF_EXTRACT_PAGES_PER_TASK = int(os.getenv("PDF_EXTRACT_PAGES_PER_TASK", "25"))
+PDF_EXTRACT_MAX_PAGES = int(os.getenv("PDF_EXTRACT_MAX_PAGES", "500"))
+PDF_EXTRACT_TIMEOUT = float(os.getenv("PDF_EXTRACT_TIMEOUT", "60"))
+
+
+class PdfExtractionError(Exception):
+    pass
+
+
+class PdfTooLargeError(PdfExtractionError):
+    pass
+
+
+class PdfExtractionTimeoutError(PdfExtractionError):
+    pass
+
+
+# ---- 자식 프로세스에서 실행되는 함수들 (pickle 가능하도록 모듈 최상위에 둔다) ----
+
+def _clean_page_text(t: str) -> str:
+    t = re.sub(r'\s+', ' ', t)                # 공백 정리
+    t = re.sub(r'\d+\s*$', '', t)            # 페이지 번호 제거
+    return t.strip()
+
+
+def _open_reader(source: bytes | str) -> PdfReader:
+    # 큰 파일은 경로만 넘겨 프로세스 간 바이트 복사를 피한다
+    if isinstance(source, str):
+        return PdfReader(source)
+    return PdfReader(io.BytesIO(source))
+
+
+def _count_pages(source: bytes | str) -> int:
+    return len(_open_reader(source).pages)
+
+
+def _extract_page_range(source: bytes | str, start: int, end: int) -> List[str]:
+    reader = _open_reader(source)
+    texts = []
+    for page in reader.pages[start:end]:
+        t = _clean_page_text(page.extract_text() or "")
+        if t:
+            texts.append(t)
+    return texts
+
+
+# ---- 프로세스 풀 관리 ----
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # uvicorn 워커(스레드 보유)를 fork 하지 않도록 spawn 사용
+        _pool = ProcessPoolExecutor(
+            max_workers=PDF_EXTRACT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def _terminate(processes: list) -> None:
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+
+
+def _retire_pool(pool: ProcessPoolExecutor, grace: float) -> None:
+    """
+    제한 시간을 넘긴 추출 작업은 취소가 불가능하므로 풀을 교체한다.
+    - 이미 다른 요청이 교체했다면(_pool 이 다른 풀) 아무것도 하지 않는다
+    - 새 요청은 새 풀을 쓰고, 기존 풀에서 돌던 다른 문서의 작업은 grace 초 동안 마저 끝낸다
+    - grace 이후에도 남은(멈춘) 자식 프로세스는 강제로 종료한다
+    """
+    global _pool
+    if _pool is not pool:
+        return
+    _pool = None
+    processes = list((getattr(pool, "_processes", None) or {}).values())
+    pool.shutdown(wait=False)
+    if grace <= 0:
+        _terminate(processes)
+    else:
+        asyncio.get_running_loop().call_later(grace, _terminate, processes)
+
+
+def shutdown_pool() -> None:
+    global _pool
+    pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _extract(source: bytes | str, pool: ProcessPoolExecutor) -> str:
+    loop = asyncio.get_running_loop()
+
+    page_count = await loop.run_in_executor(pool, _count_pages, source)
+    if page_count > PDF_EXTRACT_MAX_PAGES:
+        raise PdfTooLargeError(
+            f"PDF has {page_count} pages (limit {PDF_EXTRACT_MAX_PAGES})"
+        )
+
+    # 페이지 구간별로 나눠 병렬 추출 후 원래 순서대로 합친다
+    step = max(1, PDF_EXTRACT_PAGES_PER_TASK)
+    ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    results = await asyncio.gather(*(
+        loop.run_in_executor(pool, _extract_page_range, source, start, end)
+        for start, end in ranges
+    ))
+    return "\n".join(t for texts in results for t in texts)
+
+
+async def extract_text(source: bytes | str) -> str:
+    """
+    PDF(바이트 또는 파일 경로)에서 페이지별로 정리된 텍스트를 추출한다.
+    pypdf 파싱은 CPU 작업이므로 이벤트 루프가 아닌 프로세스 풀에서 수행한다.
+    """
+    pool = _get_pool()
+    try:
+        return await asyncio.wait_for(_extract(source, pool), timeout=PDF_EXTRACT_TIMEOUT)
+    except asyncio.TimeoutError:
+        # 이 문서의 대기 중 작업은 wait_for 취소로 이미 빠졌고, 실행 중인 작업만 풀 교체로 정리한다
+        _retire_pool(pool, grace=PDF_EXTRACT_TIMEOUT)
+        raise PdfExtractionTimeoutError(
+            f"PDF extraction exceeded {PDF_EXTRACT_TIMEOUT:g}s"
+        )
+    except asyncio.CancelledError:
+        if asyncio.current_task().cancelling():
+            raise  # 요청 자체가 취소됨 (클라이언트 연결 끊김 등)
+        # 풀 종료로 작업이 취소된 경우
+        raise PdfExtractionError("PDF extractor was restarted, please retry")
+    except BrokenProcessPool:
+        # 자식 프로세스가 죽어 풀이 깨진 경우 (이미 교체된 풀이면 새 풀은 건드리지 않는다)
+        _retire_pool(pool, grace=0)
+        raise PdfExtractionError("PDF extractor was restarted, please retry")
+    except RuntimeError as e:
+        if pool is not _pool:
+            # 처리 도중 다른 요청이 풀을 교체해 새 작업을 넣을 수 없게 된 경우
+            raise PdfExtractionError("PDF extractor was restarted, please retry") from e
+        raise PdfExtractionError(str(e)) from e
+    except PdfExtractionError:
+        raise
+    except Exception as e:
+        raise PdfExtractionError(str(e)) from e
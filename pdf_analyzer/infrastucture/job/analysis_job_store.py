@@ -0,0 +1,65 @@
+# pdf_analyzer/infrastucture/job/analysis_job_store.py
+
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from config.async_redis_config import get_async_redis
+
+
+class AnalysisJobStore:
+    """
+    분석 작업 상태 저장소 (Redis).
+    uvicorn 워커가 여러 개여도 어느 워커에서든 작업 상태를 조회할 수 있도록
+    프로세스 메모리가 아닌 Redis에 둔다. (비동기 클라이언트 - 폴링이 이벤트 루프를 막지 않는다)
+    owner_id: 작업을 제출한 사용자. 다른 사용자의 조회는 없는 작업으로 취급한다.
+    """
+
+    KEY_PREFIX = "pdf_analysis_job"
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+            cls.__instance.ttl = int(os.getenv("PDF_ANALYSIS_JOB_TTL", str(24 * 60 * 60)))
+        return cls.__instance
+
+    @classmethod
+    def getInstance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def _key(self, job_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{job_id}"
+
+    async def create(self, job_id: str, document_id: int, owner_id: int) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc).isoformat()
+        job = {
+            "job_id": job_id,
+            "document_id": document_id,
+            "owner_id": owner_id,
+            "status": "queued",
+            "stage": "queued",
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        await get_async_redis().set(self._key(job_id), json.dumps(job), ex=self.ttl)
+        return job
+
+    async def update(self, job_id: str, **fields: Any) -> Optional[Dict[str, Any]]:
+        job = await self.get(job_id)
+        if job is None:
+            return None
+        job.update(fields)
+        job["updated_at"] = datetime.now(timezone.utc).isoformat()
+        await get_async_redis().set(self._key(job_id), json.dumps(job), ex=self.ttl)
+        return job
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raw = await get_async_redis().get(self._key(job_id))
+        if raw is None:
+            return None
+        return json.loads(raw)
@@ -0,0 +1,260 @@
+# pdf_analyzer/infrastucture/llm/llm_gateway.py
+
+import asyncio
+import os
+import random
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    RateLimitError,
+)
+
+from pdf_analyzer.application.chunking.text_chunker import count_tokens
+
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4.1")
+# 로컬 가짜 OpenAI 서버로 테스트할 때 지정 (예: http://localhost:8080/v1)
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None
+
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "64"))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "32"))
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "60"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "5"))
+LLM_BACKOFF_BASE = float(os.getenv("LLM_BACKOFF_BASE", "0.5"))
+LLM_BACKOFF_MAX = float(os.getenv("LLM_BACKOFF_MAX", "20"))
+LLM_REQUESTS_PER_MINUTE = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "500"))
+LLM_TOKENS_PER_MINUTE = float(os.getenv("LLM_TOKENS_PER_MINUTE", "200000"))
+
+
+class TokenBucket:
+    """
+    분당 허용량 기반 토큰 버킷.
+    acquire()는 버킷이 찰 때까지 기다린 뒤 차감하고, refund()로 초과 차감분을 돌려받는다.
+    """
+
+    def __init__(self, per_minute: float, capacity: float | None = None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity or per_minute
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self, amount: float = 1) -> float:
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        # 락을 잡은 순서대로 차감해 먼저 온 요청이 굶지 않도록 한다
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return waited
+                delay = (amount - self.tokens) / self.rate
+                waited += delay
+                await asyncio.sleep(delay)
+
+    def refund(self, amount: float) -> None:
+        if amount <= 0:
+            return
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class LLMUsageStats:
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.retries = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.rate_limit_wait = 0.0
+
+    def record(self, latency: float, usage: Any | None) -> None:
+        self.calls += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        if usage is not None:
+            self.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+            self.completion_tokens += getattr(usage, "completion_tokens", 0) or 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "retries": self.retries,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "avg_latency_ms": round(self.total_latency / self.calls * 1000, 1) if self.calls else 0.0,
+            "max_latency_ms": round(self.max_latency * 1000, 1),
+            "rate_limit_wait_ms": round(self.rate_limit_wait * 1000, 1),
+        }
+
+
+def _is_retryable(e: Exception) -> bool:
+    if isinstance(e, (RateLimitError, APIConnectionError)):  # APITimeoutError 포함
+        return True
+    return isinstance(e, APIStatusError) and e.status_code >= 500
+
+
+def _retry_after(e: Exception) -> Optional[float]:
+    response = getattr(e, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class LLMGateway:
+    """
+    모든 LLM 호출이 거치는 비동기 게이트웨이.
+    - AsyncOpenAI + 공유 커넥션 풀(keep-alive)
+    - 429 / 5xx / 연결 오류에 지터 포함 지수 백오프 재시도
+    - 분당 요청 수 / 토큰 수 토큰 버킷 제한
+    - 호출별 지연 시간 / 토큰 사용량 집계
+    """
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+            cls.__instance._init(*args, **kwargs)
+        return cls.__instance
+
+    @classmethod
+    def getInstance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def _init(self, base_url: str | None = None, api_key: str | None = None) -> None:
+        self.client = AsyncOpenAI(
+            base_url=base_url or OPENAI_BASE_URL,
+            api_key=api_key or os.getenv("OPENAI_API_KEY"),
+            max_retries=0,  # 재시도는 게이트웨이에서 직접 처리
+            timeout=LLM_TIMEOUT,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=LLM_MAX_CONNECTIONS,
+                    max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            ),
+        )
+        self.request_bucket = TokenBucket(LLM_REQUESTS_PER_MINUTE)
+        self.token_bucket = TokenBucket(LLM_TOKENS_PER_MINUTE)
+        self.usage = LLMUsageStats()
+
+    async def _acquire(self, prompt: str, max_tokens: int) -> int:
+        reserved = count_tokens(prompt) + max_tokens
+        waited = await self.request_bucket.acquire(1)
+        waited += await self.token_bucket.acquire(reserved)
+        self.usage.rate_limit_wait += waited
+        return reserved
+
+    def _settle(self, reserved: int, usage: Any | None) -> None:
+        # 실제 사용량이 예약량보다 적으면 차액을 버킷에 돌려준다
+        if usage is not None and getattr(usage, "total_tokens", None):
+            self.token_bucket.refund(reserved - usage.total_tokens)
+
+    async def _backoff(self, attempt: int, e: Exception) -> None:
+        self.usage.retries += 1
+        delay = _retry_after(e)
+        if delay is None:
+            delay = random.uniform(0, min(LLM_BACKOFF_MAX, LLM_BACKOFF_BASE * (2 ** attempt)))
+        print(f"[WARN] LLM call failed (attempt {attempt+1}), retrying in {delay:.2f}s: {type(e).__name__}: {e}")
+        await asyncio.sleep(delay)
+
+    async def complete(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        model: str | None = None,
+        temperature: float = 0,
+    ) -> str:
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            reserved = await self._acquire(prompt, max_tokens)
+            started = time.perf_counter()
+            try:
+                response = await self.client.chat.completions.create(
+                    model=model or OPENAI_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                )
+            except Exception as e:
+                # 실패한 시도의 예약분은 돌려준다 (재시도마다 분당 토큰 예산이 새지 않도록)
+                self.token_bucket.refund(reserved)
+                if attempt < LLM_MAX_RETRIES and _is_retryable(e):
+                    await self._backoff(attempt, e)
+                    continue
+                self.usage.failures += 1
+                raise
+
+            self.usage.record(time.perf_counter() - started, response.usage)
+            self._settle(reserved, response.usage)
+            return response.choices[0].message.content or ""
+
+    async def stream(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        model: str | None = None,
+        temperature: float = 0,
+    ) -> AsyncIterator[str]:
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            reserved = await self._acquire(prompt, max_tokens)
+            started = time.perf_counter()
+            emitted = False
+            usage = None
+            try:
+                stream = await self.client.chat.completions.create(
+                    model=model or OPENAI_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                )
+                # 소비자가 중간에 멈추거나(SSE 연결 끊김, 취소) 오류가 나도 응답을 닫아 커넥션을 풀에 돌려준다
+                async with stream:
+                    async for event in stream:
+                        if event.usage is not None:
+                            usage = event.usage
+                        delta = event.choices[0].delta.content if event.choices else None
+                        if delta:
+                            emitted = True
+                            yield delta
+            except Exception as e:
+                # 토큰을 내보내기 전에 실패한 시도의 예약분은 돌려준다 (내보낸 뒤라면 이미 사용된 것으로 본다)
+                if not emitted:
+                    self.token_bucket.refund(reserved)
+                # 이미 토큰을 내보낸 뒤라면 재시도하지 않는다 (중복 출력 방지)
+                if not emitted and attempt < LLM_MAX_RETRIES and _is_retryable(e):
+                    await self._backoff(attempt, e)
+                    continue
+                self.usage.failures += 1
+                raise
+
+            self.usage.record(time.perf_counter() - started, usage)
+            self._settle(reserved, usage)
+            return
+
+    def stats(self) -> Dict[str, Any]:
+        return self.usage.snapshot()
+
+    async def aclose(self) -> None:
+        await self.client.close()
@@ -0,0 +1,193 @@
+# pdf_analyzer/infrastucture/storage/s3_object_downloader.py
+
+import asyncio
+import os
+import tempfile
+import threading
+from urllib.parse import unquote, urlparse
+
+from botocore.exceptions import ClientError
+
+from config.s3_config import AWS_S3_BUCKET, get_s3_client
+
+# 구간(Range) GET 하나의 크기 / 동시 GET 수 / 이 크기 이하는 메모리, 초과하면 임시 파일에 기록
+S3_DOWNLOAD_PART_SIZE = int(os.getenv("S3_DOWNLOAD_PART_SIZE", str(8 * 1024 * 1024)))
+S3_DOWNLOAD_CONCURRENCY = int(os.getenv("S3_DOWNLOAD_CONCURRENCY", "8"))
+S3_DOWNLOAD_SPOOL_MAX = int(os.getenv("S3_DOWNLOAD_SPOOL_MAX", str(16 * 1024 * 1024)))
+
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+class S3ObjectNotFoundError(Exception):
+    pass
+
+
+class DownloadedObject:
+    """
+    S3에서 내려받은 객체.
+    작은 객체는 data(bytes)에, 큰 객체는 path(임시 파일)에 담긴다.
+    사용 후 close()로 임시 파일을 정리한다.
+    """
+
+    def __init__(self, key: str, etag: str, size: int, data: bytes | None = None, path: str | None = None):
+        self.key = key
+        self.etag = etag
+        self.size = size
+        self.data = data
+        self.path = path
+
+    @property
+    def source(self) -> bytes | str:
+        # PDF 추출기에 넘길 입력 (bytes 또는 파일 경로)
+        return self.path if self.path is not None else self.data
+
+    def close(self) -> None:
+        if self.path is not None:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            self.path = None
+        self.data = None
+
+    def __enter__(self) -> "DownloadedObject":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def resolve_s3_location(file_url: str | None = None, s3_key: str | None = None) -> tuple[str, str]:
+    """
+    (bucket, key)를 결정한다.
+    - s3_key가 있으면 AWS_S3_BUCKET 기준으로 바로 사용
+    - 아니면 URL을 해석 (virtual-hosted / path-style 모두 지원)
+    """
+    if s3_key:
+        if not AWS_S3_BUCKET:
+            raise RuntimeError("AWS_S3_BUCKET 환경 변수가 설정되지 않았습니다.")
+        return AWS_S3_BUCKET, s3_key.lstrip("/")
+
+    if not file_url:
+        raise ValueError("file_url 또는 s3_key 중 하나는 필요합니다")
+
+    parsed = urlparse(file_url)
+    path = unquote(parsed.path.lstrip("/"))
+    if ".s3." in parsed.netloc or parsed.netloc.endswith(".s3.amazonaws.com"):
+        # https://{bucket}.s3.{region}.amazonaws.com/{key}
+        return parsed.netloc.split(".s3")[0], path
+
+    # https://s3.{region}.amazonaws.com/{bucket}/{key} 또는 로컬 엔드포인트
+    bucket, _, key = path.partition("/")
+    return bucket, key
+
+
+def _is_not_found(e: ClientError) -> bool:
+    code = e.response.get("Error", {}).get("Code")
+    return code in ("404", "NoSuchKey", "NotFound")
+
+
+def _head(bucket: str, key: str) -> dict:
+    try:
+        return get_s3_client().head_object(Bucket=bucket, Key=key)
+    except ClientError as e:
+        if _is_not_found(e):
+            raise S3ObjectNotFoundError(f"s3://{bucket}/{key}") from e
+        raise
+
+
+def _get_whole(bucket: str, key: str, etag: str) -> bytes:
+    response = get_s3_client().get_object(Bucket=bucket, Key=key, IfMatch=etag)
+    return response["Body"].read()
+
+
+def _get_range_to_fd(
+    bucket: str, key: str, etag: str, fd: int, start: int, end: int, aborted: threading.Event
+) -> None:
+    if aborted.is_set():
+        return
+    response = get_s3_client().get_object(
+        Bucket=bucket, Key=key, IfMatch=etag, Range=f"bytes={start}-{end}"
+    )
+    body = response["Body"]
+    try:
+        position = start
+        for chunk in body.iter_chunks(_STREAM_CHUNK_SIZE):
+            if aborted.is_set():
+                return
+            os.pwrite(fd, chunk, position)
+            position += len(chunk)
+    finally:
+        body.close()
+
+
+async def _join(tasks: list[asyncio.Task]) -> None:
+    """
+    작업이 모두 끝날 때까지 기다린다. (도중에 취소가 와도 기다림은 계속한다)
+    to_thread 로 돌고 있는 스레드는 취소되지 않으므로, fd 를 닫기 전에 반드시 끝나야 한다.
+    """
+    cancelled = False
+    pending = {t for t in tasks if not t.done()}
+    while pending:
+        try:
+            _, pending = await asyncio.wait(pending)
+        except asyncio.CancelledError:
+            cancelled = True
+    for t in tasks:
+        if not t.cancelled():
+            t.exception()  # "Task exception was never retrieved" 방지
+    if cancelled:
+        raise asyncio.CancelledError
+
+
+async def head_object(bucket: str, key: str) -> dict:
+    return await asyncio.to_thread(_head, bucket, key)
+
+
+async def download_object(bucket: str, key: str, head: dict | None = None) -> DownloadedObject:
+    """
+    공유 S3 클라이언트로 객체를 내려받는다. (블로킹 I/O는 스레드에서 수행)
+    큰 객체는 구간별 병렬 GET으로 임시 파일에 바로 기록해 메모리 사용을 제한한다.
+    """
+    if head is None:
+        head = await head_object(bucket, key)
+    size = int(head["ContentLength"])
+    etag = head["ETag"]
+
+    if size <= S3_DOWNLOAD_SPOOL_MAX:
+        data = await asyncio.to_thread(_get_whole, bucket, key, etag)
+        return DownloadedObject(key, etag, size, data=data)
+
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    downloaded = DownloadedObject(key, etag, size, path=path)
+    try:
+        os.ftruncate(fd, size)
+        semaphore = asyncio.Semaphore(max(1, S3_DOWNLOAD_CONCURRENCY))
+        part_size = max(1, S3_DOWNLOAD_PART_SIZE)
+
+        aborted = threading.Event()
+
+        async def fetch(start: int) -> None:
+            end = min(start + part_size, size) - 1
+            async with semaphore:
+                await asyncio.to_thread(_get_range_to_fd, bucket, key, etag, fd, start, end, aborted)
+
+        tasks = [asyncio.create_task(fetch(start)) for start in range(0, size, part_size)]
+        try:
+            # asyncio.wait 는 취소돼도 하위 작업을 취소하지 않는다 (gather 와 달리 스레드를 고아로 만들지 않음)
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            failed = next((t for t in tasks if t in done and t.exception() is not None), None)
+            if failed is not None:
+                raise failed.exception()
+        except BaseException:
+            # 남은 구간은 시작하지 않고, 진행 중인 스레드는 다음 청크에서 멈추게 한 뒤 모두 끝날 때까지 기다린다
+            aborted.set()
+            await _join(tasks)
+            raise
+    except BaseException:
+        downloaded.close()
+        raise
+    finally:
+        os.close(fd)
+
+    return downloaded
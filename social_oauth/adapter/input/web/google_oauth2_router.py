@@ -1,21 +1,22 @@
 import json
 import uuid
-from fastapi import APIRouter, Response, Request, Cookie
+from fastapi import APIRouter, Depends, Response, Request, Cookie
 from fastapi.responses import RedirectResponse
 
-from account.application.usecase.account_usecase import AccountUseCase
-from account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
-from config.redis_config import get_redis
+from account.adapter.input.web.account_dependency import get_account_usecase
+from account.adapter.input.web.session_helper import session_refresher, set_session_cookie, touch_session
+from account.application.usecase.async_account_usecase import AsyncAccountUseCase
+from account.infrastructure.cache.session_cache import SessionCache
+from account.infrastructure.cache.session_ttl_refresher import SESSION_TTL_SECONDS
+from config.async_redis_config import get_async_redis
 from social_oauth.application.usecase.google_oauth2_usecase import GoogleOAuth2UseCase
 from social_oauth.infrastructure.service.google_oauth2_service import GoogleOAuth2Service
 
 authentication_router = APIRouter()
 service = GoogleOAuth2Service()
-account_repository = AccountRepositoryImpl()
-account_usecase = AccountUseCase(account_repository)
 google_usecase = GoogleOAuth2UseCase(service)
 
-redis_client = get_redis()
+session_cache = SessionCache.getInstance()
 
 
 @authentication_router.get("/google")
@@ -34,19 +35,20 @@ async def redirect_to_google():
 async def process_google_redirect(
     response: Response,
     code: str,
-    state: str | None = None
+    state: str | None = None,
+    account_usecase: AsyncAccountUseCase = Depends(get_account_usecase),
 ):
     print("[DEBUG] /google/redirect called")
     print("code:", code)
     print("state:", state)
 
-    result = google_usecase.fetch_user_profile(code, state or "")
+    result = await google_usecase.fetch_user_profile(code, state or "")
     profile = result["profile"]
     access_token = result["access_token"]
     print("profile:", profile)
 
     # 계정 생성/조회
-    account = account_usecase.create_or_get_account(
+    account = await account_usecase.create_or_get_account(
         profile.get("email"),
         profile.get("name")
     )
@@ -56,31 +58,24 @@ async def process_google_redirect(
     print("[DEBUG] Generated session_id:", session_id)
 
     # 4. Redis에 저장 (user_id + access_token)
-    redis_client.set(
+    await get_async_redis().set(
         f"session:{session_id}",
         json.dumps({
             "user_id": account.id,
             "access_token": access_token.access_token  # <-- 객체가 아닌 문자열
         }),
-        ex=6 * 60 * 60  # 6시간
+        ex=SESSION_TTL_SECONDS  # 이후 요청마다 sliding 연장
     )
 
     # HTTP-only 쿠키 발급
     redirect_response = RedirectResponse("http://localhost:3000")
-    redirect_response.set_cookie(
-        key="session_id",
-        value=session_id,
-        httponly=True,
-        secure=False,
-        samesite="lax",
-        max_age=6 * 60 * 60
-    )
+    set_session_cookie(redirect_response, session_id)
 
     print("[DEBUG] Cookie set in RedirectResponse directly")
     return redirect_response
 
 @authentication_router.get("/status")
-async def auth_status(request: Request, session_id: str | None = Cookie(None)):
+async def auth_status(request: Request, response: Response, session_id: str | None = Cookie(None)):
     print("[DEBUG] /status called")
     print("[DEBUG] Request headers:", request.headers)
     print("[DEBUG] Received session_id cookie:", session_id)
@@ -89,23 +84,26 @@ async def auth_status(request: Request, session_id: str | None = Cookie(None)):
         print("[DEBUG] No session_id received. Returning logged_in: False")
         return {"logged_in": False}
 
-    # Redis에서 실제 키 확인
-    redis_key = f"session:{session_id}"
-    session_data = redis_client.get(redis_key)
+    # 로컬 세션 캐시 → (없으면) Redis 확인
+    session_dict = await session_cache.get(session_id)
 
-    if not session_data:
+    if not session_dict:
         print("[DEBUG] Session not found in Redis. Returning logged_in: False")
         return {"logged_in": False}
 
-    # bytes -> str 변환
-    if isinstance(session_data, bytes):
-        session_data = session_data.decode("utf-8")
-
-    # JSON 파싱
-    import json
-    session_dict = json.loads(session_data)
     user_id = session_dict.get("user_id")
+    touch_session(response, session_id)
 
     print("[DEBUG] Session valid. user_id:", user_id)
     return {"logged_in": True, "user_id": user_id}
 
+
+@authentication_router.post("/logout")
+async def logout(response: Response, session_id: str | None = Cookie(None)):
+    # Redis 세션 삭제 + 모든 워커의 로컬 세션 캐시 무효화
+    if session_id:
+        session_refresher.forget(session_id)
+        await session_cache.delete(session_id)
+
+    response.delete_cookie(key="session_id", httponly=True, samesite="lax")
+    return {"logged_out": True}
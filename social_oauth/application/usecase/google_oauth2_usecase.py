@@ -1,4 +1,3 @@
-from account.application.port.account_repository_port import AccountRepositoryPort
 from account.domain.account import Account
 from social_oauth.infrastructure.service.google_oauth2_service import GoogleOAuth2Service, GetAccessTokenRequest, \
     AccessToken
@@ -11,13 +10,13 @@ class GoogleOAuth2UseCase:
     def get_authorization_url(self) -> str:
         return self.service.get_authorization_url()
 
-    def login_and_fetch_user(self, state: str, code: str) -> AccessToken:
+    async def login_and_fetch_user(self, state: str, code: str) -> AccessToken:
         # 코드 -> 액세스 토큰
         token_request = GetAccessTokenRequest(state=state, code=code)
-        access_token = self.service.refresh_access_token(token_request)
+        access_token = await self.service.refresh_access_token(token_request)
 
         # 액세스 토큰으로 사용자 프로필 가져오기
-        user_profile = self.service.fetch_user_profile(access_token)
+        user_profile = await self.service.fetch_user_profile(access_token)
         email = user_profile.get("email")
         nickname = user_profile.get("nickname")
 
@@ -33,9 +32,10 @@ class GoogleOAuth2UseCase:
         # AccessToken 반환 (DB 처리 완료 후)
         return access_token
 
-    def fetch_user_profile(self, code: str, state: str) -> dict:
+    async def fetch_user_profile(self, code: str, state: str) -> dict:
         token_request = GetAccessTokenRequest(state=state, code=code)
-        access_token = self.service.refresh_access_token(token_request)
+        access_token = await self.service.refresh_access_token(token_request)
 
-        profile = self.service.fetch_user_profile(access_token)
+        # id_token 검증이 가능하면 userinfo 호출 없이 프로필을 얻는다
+        profile = await self.service.fetch_user_profile(access_token)
         return {"profile": profile, "access_token": access_token}
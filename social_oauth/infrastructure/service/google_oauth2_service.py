@@ -1,16 +1,53 @@
+import asyncio
 import os
-import requests
+import re
+import time
 from urllib.parse import quote
 
+import httpx
+import jwt
+
 from social_oauth.adapter.input.web.request.get_access_token_request import GetAccessTokenRequest
 from social_oauth.adapter.input.web.response.access_token import AccessToken
 
-GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth"
-GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
-GOOGLE_USERINFO_URL = "https://www.googleapis.com/oauth2/v3/userinfo"
+# 로컬 가짜 OAuth 서버로 테스트할 수 있도록 엔드포인트는 환경 변수로 교체 가능
+GOOGLE_AUTH_URL = os.getenv("GOOGLE_AUTH_URL", "https://accounts.google.com/o/oauth2/v2/auth")
+GOOGLE_TOKEN_URL = os.getenv("GOOGLE_TOKEN_URL", "https://oauth2.googleapis.com/token")
+GOOGLE_USERINFO_URL = os.getenv("GOOGLE_USERINFO_URL", "https://www.googleapis.com/oauth2/v3/userinfo")
+GOOGLE_JWKS_URL = os.getenv("GOOGLE_JWKS_URL", "https://www.googleapis.com/oauth2/v3/certs")
+GOOGLE_ISSUERS = os.getenv("GOOGLE_ISSUERS", "https://accounts.google.com,accounts.google.com").split(",")
+
+# id_token 을 로컬에서 검증해 프로필을 얻으면 userinfo 호출을 생략한다
+GOOGLE_PROFILE_FROM_ID_TOKEN = os.getenv("GOOGLE_PROFILE_FROM_ID_TOKEN", "true").lower() == "true"
+GOOGLE_HTTP_TIMEOUT = float(os.getenv("GOOGLE_HTTP_TIMEOUT", "10"))
+GOOGLE_HTTP_CONNECT_TIMEOUT = float(os.getenv("GOOGLE_HTTP_CONNECT_TIMEOUT", "3"))
+# Cache-Control max-age 가 없을 때 JWKS 캐시 시간(초)
+GOOGLE_JWKS_DEFAULT_TTL = int(os.getenv("GOOGLE_JWKS_DEFAULT_TTL", "3600"))
+GOOGLE_ID_TOKEN_LEEWAY = int(os.getenv("GOOGLE_ID_TOKEN_LEEWAY", "30"))
 
 class GoogleOAuth2Service:
 
+    def __init__(self):
+        self._client: httpx.AsyncClient | None = None
+        self._jwks: dict[str, jwt.PyJWK] = {}
+        self._jwks_expires_at = 0.0
+        self._jwks_lock = asyncio.Lock()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # keep-alive 커넥션을 재사용하도록 클라이언트 하나를 공유
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(GOOGLE_HTTP_TIMEOUT, connect=GOOGLE_HTTP_CONNECT_TIMEOUT),
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
     def get_authorization_url(self) -> str:
         client_id = os.getenv("GOOGLE_CLIENT_ID")
         redirect_uri = quote(os.getenv("GOOGLE_REDIRECT_URI"), safe='')
@@ -23,7 +60,7 @@ class GoogleOAuth2Service:
             f"&scope={quote(scope)}"
         )
 
-    def refresh_access_token(self, request: GetAccessTokenRequest) -> AccessToken:
+    async def refresh_access_token(self, request: GetAccessTokenRequest) -> AccessToken:
         data = {
             "code": request.code,
             "client_id": os.getenv("GOOGLE_CLIENT_ID"),
@@ -31,7 +68,7 @@ class GoogleOAuth2Service:
             "redirect_uri": os.getenv("GOOGLE_REDIRECT_URI"),
             "grant_type": "authorization_code"
         }
-        resp = requests.post(GOOGLE_TOKEN_URL, data=data)
+        resp = await self.client.post(GOOGLE_TOKEN_URL, data=data)
         resp.raise_for_status()
         token_data = resp.json()
         # Pydantic 모델에 맞춰서 변환
@@ -39,11 +76,70 @@ class GoogleOAuth2Service:
             access_token=token_data.get("access_token"),
             token_type=token_data.get("token_type"),
             expires_in=token_data.get("expires_in"),
-            refresh_token=token_data.get("refresh_token")
+            refresh_token=token_data.get("refresh_token"),
+            id_token=token_data.get("id_token"),
         )
 
-    def fetch_user_profile(self, access_token: AccessToken) -> dict:
+    async def fetch_user_profile(self, access_token: AccessToken) -> dict:
+        if GOOGLE_PROFILE_FROM_ID_TOKEN and access_token.id_token:
+            try:
+                return await self.verify_id_token(access_token.id_token)
+            except (jwt.PyJWTError, httpx.HTTPError) as e:
+                # 검증할 수 없으면 userinfo 로 조회
+                print(f"[WARN] id_token verification failed, falling back to userinfo: {e}")
+
         headers = {"Authorization": f"Bearer {access_token.access_token}"}
-        resp = requests.get(GOOGLE_USERINFO_URL, headers=headers)
+        resp = await self.client.get(GOOGLE_USERINFO_URL, headers=headers)
         resp.raise_for_status()
         return resp.json()
+
+    async def verify_id_token(self, id_token: str) -> dict:
+        """
+        id_token 서명(JWKS)과 aud / iss / exp 를 로컬에서 검증하고 프로필 클레임을 반환.
+        """
+        kid = jwt.get_unverified_header(id_token).get("kid")
+        key = await self._get_signing_key(kid)
+
+        claims = jwt.decode(
+            id_token,
+            key.key,
+            algorithms=["RS256"],
+            audience=os.getenv("GOOGLE_CLIENT_ID"),
+            leeway=GOOGLE_ID_TOKEN_LEEWAY,
+            options={"require": ["exp", "iat", "iss", "aud", "sub"]},
+        )
+        if claims.get("iss") not in GOOGLE_ISSUERS:
+            raise jwt.InvalidIssuerError("Invalid issuer")
+
+        # userinfo 응답과 같은 필드 이름으로 맞춘다
+        return {
+            name: claims[name]
+            for name in ("sub", "email", "email_verified", "name", "given_name", "family_name", "picture", "locale")
+            if name in claims
+        }
+
+    async def _get_signing_key(self, kid: str | None) -> jwt.PyJWK:
+        if kid in self._jwks and time.monotonic() < self._jwks_expires_at:
+            return self._jwks[kid]
+
+        async with self._jwks_lock:
+            # 만료되었거나 처음 보는 kid(키 교체)면 다시 받아온다
+            if kid not in self._jwks or time.monotonic() >= self._jwks_expires_at:
+                await self._refresh_jwks()
+
+        if kid not in self._jwks:
+            raise jwt.InvalidKeyError(f"Unknown signing key: {kid}")
+        return self._jwks[kid]
+
+    async def _refresh_jwks(self) -> None:
+        resp = await self.client.get(GOOGLE_JWKS_URL)
+        resp.raise_for_status()
+
+        self._jwks = {
+            jwk["kid"]: jwt.PyJWK(jwk)
+            for jwk in resp.json().get("keys", [])
+            if jwk.get("kid")
+        }
+        match = re.search(r"max-age=(\d+)", resp.headers.get("cache-control", ""))
+        ttl = int(match.group(1)) if match else GOOGLE_JWKS_DEFAULT_TTL
+        self._jwks_expires_at = time.monotonic() + ttl